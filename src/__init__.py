@@ -15,8 +15,11 @@ __version__ = "0.1.0"
 # Import key functions for package-level access
 from .betting_framework import (
     normalize_contract_price,
+    normalize_contract_price_array,
     calculate_whole_contracts,
+    calculate_whole_contracts_batch,
     user_input_betting_framework,
+    user_input_betting_framework_batch,
 )
 
 # Make examples available at package level
@@ -28,6 +31,7 @@ from .excel_processor import (
     list_available_input_files,
     get_input_file_path,
     apply_bankroll_allocation,
+    build_result_row,
 )
 
 from .main import main
@@ -35,8 +39,11 @@ from .main import main
 __all__ = [
     # Core betting functions
     "normalize_contract_price",
+    "normalize_contract_price_array",
     "calculate_whole_contracts", 
+    "calculate_whole_contracts_batch",
     "user_input_betting_framework",
+    "user_input_betting_framework_batch",
     
     # Excel processing functions
     "process_betting_excel",
@@ -44,6 +51,7 @@ __all__ = [
     "list_available_input_files",
     "get_input_file_path",
     "apply_bankroll_allocation",
+    "build_result_row",
     
     # Main entry point
     "main",
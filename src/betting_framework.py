@@ -1,5 +1,13 @@
 from typing import Optional, Dict, Any, Union
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# Wharton methodology constants shared by the scalar and batch frameworks
+WHARTON_EV_THRESHOLD = 10.0   # Minimum EV percentage to place a bet
+HALF_KELLY_MULTIPLIER = 0.5   # Fraction of full Kelly to bet
+MAX_BET_FRACTION = 0.15       # Maximum share of bankroll on one bet
+
 def normalize_contract_price(contract_price: Union[int, float]) -> float:
     """
     Normalize contract price to dollar format.
@@ -22,6 +30,20 @@ def normalize_contract_price(contract_price: Union[int, float]) -> float:
         return contract_price
 
 
+def normalize_contract_price_array(contract_prices: ArrayLike) -> NDArray[np.float64]:
+    """
+    Vectorized version of normalize_contract_price() for a slate of contracts.
+    
+    Args:
+        contract_prices: Prices in either cents (whole numbers) or dollars (decimals)
+        
+    Returns:
+        ndarray: Prices normalized to dollars
+    """
+    prices = np.asarray(contract_prices, dtype=np.float64)
+    return np.where(prices >= 1.0, prices / 100.0, prices)
+
+
 def calculate_whole_contracts(
     target_bet_amount: float, 
     contract_price: Union[int, float], 
@@ -78,6 +100,49 @@ def calculate_whole_contracts(
     }
 
 
+def calculate_whole_contracts_batch(
+    target_bet_amounts: ArrayLike,
+    contract_prices: ArrayLike,
+    commissions_per_contract: Optional[ArrayLike] = None
+) -> Dict[str, NDArray[Any]]:
+    """
+    Vectorized version of calculate_whole_contracts() for a slate of bets.
+    
+    Args:
+        target_bet_amounts: Ideal bet amounts from Kelly/Wharton calculation
+        contract_prices: Prices per contract (normalized to dollars)
+        commissions_per_contract: Commission per contract (optional, uses CommissionManager if None)
+        
+    Returns:
+        dict of arrays with the same keys as calculate_whole_contracts()
+    """
+    # Import here to avoid circular imports
+    if __package__:
+        from .commission_manager import commission_manager
+    else:
+        from commission_manager import commission_manager
+    
+    if commissions_per_contract is None:
+        commissions_per_contract = commission_manager.get_commission_rate()
+    
+    target_bet_amounts = np.asarray(target_bet_amounts, dtype=np.float64)
+    adjusted_price = (
+        np.asarray(contract_prices, dtype=np.float64)
+        + np.asarray(commissions_per_contract, dtype=np.float64)
+    )
+    
+    # Floor of the true quotient, matching int() in the scalar version
+    whole_contracts = np.floor(target_bet_amounts / adjusted_price).astype(np.int64)
+    actual_bet_amount = whole_contracts * adjusted_price
+    
+    return {
+        'whole_contracts': whole_contracts,
+        'actual_bet_amount': actual_bet_amount,
+        'unused_amount': target_bet_amounts - actual_bet_amount,
+        'adjusted_price': adjusted_price
+    }
+
+
 def user_input_betting_framework(
     weekly_bankroll: float, 
     model_win_percentage: Union[int, float], 
@@ -128,7 +193,7 @@ def user_input_betting_framework(
     ev_percentage = ev_per_dollar * 100
     
     # Step 2: Apply Wharton's 10% EV threshold
-    if ev_percentage < 10.0:
+    if ev_percentage < WHARTON_EV_THRESHOLD:
         # Calculate what EV would be without commission for comparison
         ev_without_commission = (win_probability * (1/normalized_price) - 1) * 100
         commission_impact = ev_without_commission - ev_percentage
@@ -175,10 +240,10 @@ def user_input_betting_framework(
         }
     
     # Step 4: Apply Half Kelly (Wharton optimal)
-    half_kelly_fraction = full_kelly_fraction * 0.5
+    half_kelly_fraction = full_kelly_fraction * HALF_KELLY_MULTIPLIER
     
     # Step 5: Apply maximum bet constraint (15% of bankroll)
-    final_fraction = min(half_kelly_fraction, 0.15)
+    final_fraction = min(half_kelly_fraction, MAX_BET_FRACTION)
     
     # Step 6: Calculate bet amount
     target_bet_amount = final_fraction * weekly_bankroll
@@ -230,3 +295,83 @@ def user_input_betting_framework(
         'wharton_compliant': True,
         'whole_contracts_only': True
     }
+
+
+def user_input_betting_framework_batch(
+    weekly_bankrolls: ArrayLike,
+    model_win_percentages: ArrayLike,
+    contract_prices: ArrayLike,
+    commissions_per_contract: Optional[ArrayLike] = None
+) -> Dict[str, NDArray[Any]]:
+    """
+    Vectorized version of user_input_betting_framework() for a slate of bets.
+    
+    Applies the same Wharton rules (10% EV threshold, Half Kelly, 15% cap,
+    whole contracts only) to every element of the input arrays at once.
+    Inputs broadcast against each other, so a scalar bankroll or commission
+    can be paired with arrays of win percentages and prices.
+    
+    Args:
+        weekly_bankrolls: Bankroll per bet
+        model_win_percentages: Win probabilities (0-1 or 0-100)
+        contract_prices: Contract prices (dollars or cents)
+        commissions_per_contract: Commission per contract (optional, uses CommissionManager if None)
+        
+    Returns:
+        dict of arrays: {
+            'decision': 'BET' or 'NO BET' per bet
+            'ev_percentage': EV percentage using commission-adjusted price
+            'bet_amount': Actual amount for whole contracts (0 for NO BET)
+            'contracts_to_buy': Whole contracts to buy (0 for NO BET)
+            'target_bet_amount': Kelly/Wharton target (0 when EV or Kelly rejects)
+            'normalized_price': Price in dollars
+            'adjusted_price': Price plus commission
+        }
+    """
+    # Import here to avoid circular imports
+    try:
+        from .commission_manager import commission_manager
+    except ImportError:
+        from commission_manager import commission_manager
+    
+    if commissions_per_contract is None:
+        commissions_per_contract = commission_manager.get_commission_rate()
+    
+    bankroll, win_pct, price, commission = np.broadcast_arrays(
+        np.asarray(weekly_bankrolls, dtype=np.float64),
+        np.asarray(model_win_percentages, dtype=np.float64),
+        np.asarray(contract_prices, dtype=np.float64),
+        np.asarray(commissions_per_contract, dtype=np.float64)
+    )
+    
+    # Same operation order as the scalar framework so results match exactly
+    win_probability = np.where(win_pct <= 1, win_pct, win_pct / 100)
+    normalized_price = normalize_contract_price_array(price)
+    adjusted_price = normalized_price + commission
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ev_per_dollar = win_probability * (1 / adjusted_price) - 1
+        ev_percentage = ev_per_dollar * 100
+        
+        b = (1 / adjusted_price) - 1
+        full_kelly_fraction = (b * win_probability - (1 - win_probability)) / b
+        final_fraction = np.minimum(
+            full_kelly_fraction * HALF_KELLY_MULTIPLIER, MAX_BET_FRACTION
+        )
+        
+        sized = (ev_percentage >= WHARTON_EV_THRESHOLD) & (full_kelly_fraction > 0)
+        target_bet_amount = np.where(sized, final_fraction * bankroll, 0.0)
+        whole_contracts = np.where(sized, np.floor(target_bet_amount / adjusted_price), 0.0)
+    
+    contracts_to_buy = whole_contracts.astype(np.int64)
+    is_bet = contracts_to_buy > 0
+    
+    return {
+        'decision': np.where(is_bet, 'BET', 'NO BET'),
+        'ev_percentage': ev_percentage,
+        'bet_amount': np.where(is_bet, contracts_to_buy * adjusted_price, 0.0),
+        'contracts_to_buy': contracts_to_buy,
+        'target_bet_amount': target_bet_amount,
+        'normalized_price': normalized_price,
+        'adjusted_price': adjusted_price
+    }
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, List, Union
@@ -319,6 +320,79 @@ def create_sample_excel_in_input_dir() -> Path:
     print(f"Sample Excel file created: {sample_file_path}")
     return sample_file_path
 
+def _get_model_margin(input_row: Any) -> Optional[float]:
+    """Return the row's Model Margin, or None when the column is absent or empty."""
+    margin_val = input_row.get('Model Margin', None)
+    # Only use the value if it's not null/nan
+    return margin_val if pd.notna(margin_val) else None
+
+
+def build_result_row(input_row: Any, betting_result: Dict[str, Any], commission_rate: Optional[float] = None) -> Dict[str, Union[str, float, int]]:
+    """
+    Build the output row for one game from its input row and framework result.
+    
+    Args:
+        input_row: Input sheet row (Series or dict) with Game, Model Win Percentage,
+            Contract Price and optionally Model Margin
+        betting_result: Dictionary returned by user_input_betting_framework
+        commission_rate: Commission per contract to record; defaults to the
+            commission manager's current rate
+    
+    Returns:
+        Dictionary keyed by final output column names
+    """
+    if commission_rate is None:
+        commission_rate = commission_manager.get_commission_rate()
+    win_pct = input_row['Model Win Percentage']
+    win_margin = _get_model_margin(input_row)
+    
+    # Calculate Net Profit (what you win if bet hits, accounting for total cost)
+    net_profit = 0
+    if betting_result['decision'] == 'BET':
+        contracts = betting_result.get('contracts_to_buy', 0)
+        adjusted_price = betting_result.get('adjusted_price', 0)
+        total_cost = contracts * adjusted_price
+        payout_if_win = contracts * 1.0  # $1 per contract if win
+        net_profit = payout_if_win - total_cost
+    
+    # Enhance reason with commission impact details for Excel display
+    enhanced_reason = betting_result.get('reason', '')
+    if betting_result['decision'] == 'NO BET' and enhanced_reason:
+        # Add commission impact context to reasons when relevant
+        if 'commission_impact' in betting_result and betting_result['commission_impact'] > 0.5:
+            enhanced_reason += f" [Commission impact: -{betting_result['commission_impact']:.1f}% EV]"
+        elif 'commission_increase_pct' in betting_result and betting_result['commission_increase_pct'] > 5:
+            enhanced_reason += f" [Commission adds {betting_result['commission_increase_pct']:.0f}% to min bet]"
+    
+    # Store results using final column names directly
+    result_row: Dict[str, Union[str, float, int]] = {
+        'Game': input_row['Game'],
+        'Win %': win_pct / 100 if win_pct > 1 else win_pct,  # Convert to decimal if > 1
+        'Contract Price (¢)': input_row['Contract Price'],
+        'Decision': betting_result['decision'],
+        'EV Percentage': betting_result['ev_percentage'] / 100,  # Store as decimal for Excel formatting
+        'Bet Amount': betting_result['bet_amount'],
+        'Bet Percentage': betting_result.get('bet_percentage', 0) / 100,  # Store as decimal for Excel formatting
+        'Net Profit': net_profit,
+        'Expected Value EV': betting_result.get('expected_profit', 0),
+        'Contracts To Buy': betting_result.get('contracts_to_buy', 0),
+        'Adjusted Price': betting_result.get('adjusted_price', 0),
+        'Target Bet Amount': betting_result.get('target_bet_amount', betting_result['bet_amount']),
+        'Unused Amount': betting_result.get('unused_amount', 0),
+        'Reason': enhanced_reason,
+        'Final Recommendation': '',  # Will be filled by allocation logic
+        'Cumulative Bet Amount': 0.0,   # Will be filled by allocation logic
+        'Commission Rate': commission_rate,
+        'Platform': commission_manager.get_current_platform()
+    }
+    
+    # Only add Margin column if we have margin data
+    if win_margin is not None:
+        result_row['Margin'] = win_margin
+    
+    return result_row
+
+
 def process_betting_excel(
     excel_file_path: Union[str, Path], 
     weekly_bankroll: float, 
@@ -351,7 +425,12 @@ def process_betting_excel(
     try:
         # Read the Excel file
         print(f"Reading Excel file: {excel_file_path}")
-        df = pd.read_excel(str(excel_file_path), sheet_name=sheet_name)
+        # Parse the numeric inputs as floats up front so bad cells fail here rather than mid-calculation
+        df = pd.read_excel(
+            str(excel_file_path),
+            sheet_name=sheet_name,
+            dtype={'Model Win Percentage': 'float64', 'Contract Price': 'float64'}
+        )
         assert isinstance(df, pd.DataFrame), "Expected DataFrame from read_excel"
         print(f"Found {len(df)} games to analyze")
         
@@ -368,13 +447,8 @@ def process_betting_excel(
             win_pct = row['Model Win Percentage']
             contract_price = row['Contract Price']
             
-            # Handle margin value - check if column exists and has non-null value
-            win_margin = None
-            if 'Model Margin' in df.columns:
-                margin_val = row.get('Model Margin', None)
-                # Only use the value if it's not null/nan
-                if pd.notna(margin_val):
-                    win_margin = margin_val
+            # Handle margin value - only used when the column exists and is non-null
+            win_margin = _get_model_margin(row)
             
             print(f"Processing: {game}")
             
@@ -387,51 +461,7 @@ def process_betting_excel(
                 commission_per_contract=commission_manager.get_commission_rate()
             )
             
-            # Calculate Net Profit (what you win if bet hits, accounting for total cost)
-            net_profit = 0
-            if result['decision'] == 'BET':
-                contracts = result.get('contracts_to_buy', 0)
-                adjusted_price = result.get('adjusted_price', 0)
-                total_cost = contracts * adjusted_price
-                payout_if_win = contracts * 1.0  # $1 per contract if win
-                net_profit = payout_if_win - total_cost
-            
-            # Enhance reason with commission impact details for Excel display
-            enhanced_reason = result.get('reason', '')
-            if result['decision'] == 'NO BET' and enhanced_reason:
-                # Add commission impact context to reasons when relevant
-                if 'commission_impact' in result and result['commission_impact'] > 0.5:
-                    enhanced_reason += f" [Commission impact: -{result['commission_impact']:.1f}% EV]"
-                elif 'commission_increase_pct' in result and result['commission_increase_pct'] > 5:
-                    enhanced_reason += f" [Commission adds {result['commission_increase_pct']:.0f}% to min bet]"
-            
-            # Store results using final column names directly
-            result_row: Dict[str, Union[str, float, int]] = {
-                'Game': game,
-                'Win %': win_pct / 100 if win_pct > 1 else win_pct,  # Convert to decimal if > 1
-                'Contract Price (¢)': contract_price,
-                'Decision': result['decision'],
-                'EV Percentage': result['ev_percentage'] / 100,  # Store as decimal for Excel formatting
-                'Bet Amount': result['bet_amount'],
-                'Bet Percentage': result.get('bet_percentage', 0) / 100,  # Store as decimal for Excel formatting
-                'Net Profit': net_profit,
-                'Expected Value EV': result.get('expected_profit', 0),
-                'Contracts To Buy': result.get('contracts_to_buy', 0),
-                'Adjusted Price': result.get('adjusted_price', 0),
-                'Target Bet Amount': result.get('target_bet_amount', result['bet_amount']),
-                'Unused Amount': result.get('unused_amount', 0),
-                'Reason': enhanced_reason,
-                'Final Recommendation': '',  # Will be filled by allocation logic
-                'Cumulative Bet Amount': 0.0,   # Will be filled by allocation logic
-                'Commission Rate': commission_manager.get_commission_rate(),
-                'Platform': commission_manager.get_current_platform()
-            }
-            
-            # Only add Margin column if we have margin data
-            if win_margin is not None:
-                result_row['Margin'] = win_margin
-            
-            results.append(result_row)
+            results.append(build_result_row(row, result))
         
         # Create results DataFrame
         results_df = pd.DataFrame(results)
@@ -571,45 +601,65 @@ def apply_bankroll_allocation(df: pd.DataFrame, weekly_bankroll: float) -> pd.Da
     """
     Apply bankroll allocation logic to ensure total bets don't exceed weekly bankroll.
     Games are prioritized by EV percentage (highest first).
+    
+    The running balance is computed with ``np.subtract.accumulate`` so it matches
+    sequential subtraction bit-for-bit; only the rare tail after a sub-1% skip,
+    where smaller bets can still fit, is walked one row at a time.
     """
-    remaining_bankroll = weekly_bankroll
-    cumulative_bet = 0
-    
-    for index, row in df.iterrows():
-        if row['Decision'] == 'BET':
-            if remaining_bankroll > 0:
-                # Check if we can afford this bet
-                bet_amount = row['Bet Amount']
-                
-                if bet_amount <= remaining_bankroll:
-                    # Can afford full bet
-                    df.loc[index, 'Final Recommendation'] = 'BET'  # type: ignore[assignment]
-                    df.loc[index, 'Cumulative Bet Amount'] = float(bet_amount)  # type: ignore[assignment]
-                    remaining_bankroll -= bet_amount
-                    cumulative_bet += bet_amount
-                else:
-                    # Can't afford full bet - could do partial or skip
-                    if remaining_bankroll >= (weekly_bankroll * 0.01):  # At least 1% of bankroll
-                        df.loc[index, 'Final Recommendation'] = f'PARTIAL BET (${remaining_bankroll:.2f})'  # type: ignore[assignment]
-                        df.loc[index, 'Cumulative Bet Amount'] = float(remaining_bankroll)  # type: ignore[assignment]
-                        cumulative_bet += remaining_bankroll
-                        remaining_bankroll = 0
-                    else:
-                        df.loc[index, 'Final Recommendation'] = 'SKIP - Insufficient Bankroll'  # type: ignore[assignment]
-                        df.loc[index, 'Cumulative Bet Amount'] = 0.0  # type: ignore[assignment]
-            else:
-                # No bankroll remaining - skip all remaining BET decisions
-                df.loc[index, 'Final Recommendation'] = 'SKIP - Insufficient Bankroll'  # type: ignore[assignment]
-                df.loc[index, 'Cumulative Bet Amount'] = 0.0  # type: ignore[assignment]
-        else:
-            # Non-BET decisions (e.g., 'NO BET') pass through unchanged
-            df.loc[index, 'Final Recommendation'] = row['Decision']  # type: ignore[assignment]
-            df.loc[index, 'Cumulative Bet Amount'] = 0.0  # type: ignore[assignment]
+    if df.empty:
+        return df
+    
+    is_bet = (df['Decision'] == 'BET').to_numpy()
+    bet_amounts = df['Bet Amount'].to_numpy(dtype=float)
+    
+    # Remaining bankroll before each row, assuming every earlier BET was placed in full
+    bet_only = np.where(is_bet, bet_amounts, 0.0)
+    remaining_before = np.subtract.accumulate(np.concatenate(([float(weekly_bankroll)], bet_only)))[:-1]
+    affordable = (remaining_before > 0) & (bet_amounts <= remaining_before)
+    
+    # Non-BET decisions (e.g., 'NO BET') pass through unchanged
+    recommendations = df['Decision'].to_numpy(dtype=object).copy()
+    cumulative = np.zeros(len(df), dtype=float)
+    
+    # Every BET up to the first unaffordable one gets its full amount
+    unaffordable = np.flatnonzero(is_bet & ~affordable)
+    cutoff = int(unaffordable[0]) if unaffordable.size else len(df)
+    full_bets = is_bet.copy()
+    full_bets[cutoff:] = False
+    recommendations[full_bets] = 'BET'
+    cumulative[full_bets] = bet_amounts[full_bets]
+    
+    if cutoff < len(df):
+        # Can't afford full bet - could do partial or skip
+        remaining_bankroll = float(remaining_before[cutoff])
+        later_bets = np.flatnonzero(is_bet[cutoff + 1:]) + cutoff + 1
+        recommendations[cutoff] = 'SKIP - Insufficient Bankroll'
+        recommendations[later_bets] = 'SKIP - Insufficient Bankroll'
+        
+        if remaining_bankroll > 0 and remaining_bankroll >= (weekly_bankroll * 0.01):  # At least 1% of bankroll
+            recommendations[cutoff] = f'PARTIAL BET (${remaining_bankroll:.2f})'
+            cumulative[cutoff] = remaining_bankroll
+        elif remaining_bankroll > 0:
+            # Below 1% the balance is kept, so smaller later bets may still fit
+            for index in later_bets:
+                if remaining_bankroll > 0 and bet_amounts[index] <= remaining_bankroll:
+                    recommendations[index] = 'BET'
+                    cumulative[index] = bet_amounts[index]
+                    remaining_bankroll -= bet_amounts[index]
+    
+    df['Final Recommendation'] = recommendations
+    df['Cumulative Bet Amount'] = cumulative
     
     return df
 
-def display_summary(df: pd.DataFrame, weekly_bankroll: float) -> None:
-    """Display a summary of the betting analysis"""
+def display_summary(df: pd.DataFrame, weekly_bankroll: float) -> Dict[str, Union[int, float]]:
+    """
+    Display a summary of the betting analysis.
+    
+    Returns:
+        Dictionary with the printed headline figures (game and bet counts,
+        allocated/remaining bankroll, expected profit, contracts and commission cost)
+    """
     print("\n" + "="*60)
     print("BETTING ANALYSIS SUMMARY")
     print("="*60)
@@ -659,6 +709,18 @@ def display_summary(df: pd.DataFrame, weekly_bankroll: float) -> None:
         for _, row in top_bets.iterrows():
             ev_pct = row['EV Percentage'] * 100  # Convert back to percentage for display
             print(f"{row['Game']}: ${row['Cumulative Bet Amount']:.2f} (EV: {ev_pct:.2f}%)")
+    
+    return {
+        'total_games': total_games,
+        'bet_opportunities': bet_opportunities,
+        'no_bet_games': no_bet_games,
+        'final_bets': final_bets,
+        'total_allocated': float(total_allocated),
+        'remaining_bankroll': float(weekly_bankroll - total_allocated),
+        'total_expected_profit': float(total_expected_profit),
+        'total_contracts': int(total_contracts),
+        'total_commission_cost': float(total_commission_cost),
+    }
 
 def create_sample_excel() -> Path:
     """Legacy function - redirects to new create_sample_excel_in_input_dir()"""
@@ -6,6 +6,8 @@ import pytest
 import pandas as pd
 from pathlib import Path
 
+from src.betting_framework import user_input_betting_framework
+
 @pytest.fixture
 def sample_betting_data():
     """Sample betting data for unit tests."""
@@ -16,6 +18,26 @@ def sample_betting_data():
     }
 
 
+@pytest.fixture(scope="session")
+def canonical_results():
+    """Framework results for the canonical inputs shared across unit tests.
+    
+    Keyed by (weekly_bankroll, model_win_percentage, contract_price, commission_per_contract).
+    """
+    inputs = [
+        (1000.0, 0.65, 0.27, 0.0),
+        (1000.0, 65.0, 0.27, 0.0),   # Percentage-format win probability
+        (1000.0, 0.65, 27, 0.0),     # Cents-format price
+        (1000.0, 0.68, 0.45, 0.0),
+        (1000.0, 68.0, 0.45, 0.0),
+        (1000.0, 68.0, 45, 0.0),     # Percentage-format win and cents-format price
+    ]
+    return {
+        key: user_input_betting_framework(*key[:3], commission_per_contract=key[3])
+        for key in inputs
+    }
+
+
 @pytest.fixture
 def sample_excel_data():
     """Sample Excel data as DataFrame for testing."""
@@ -5,13 +5,18 @@ Tests the complete Excel processing workflow from file input through betting
 recommendation output, using temporary files to test the full pipeline.
 """
 
+import functools
 import pytest
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import tempfile
 import shutil
-from typing import Any
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
 
 from src.excel_processor import (
     process_betting_excel,
@@ -22,13 +27,37 @@ from src.excel_processor import (
 from src.betting_framework import user_input_betting_framework
 from src.commission_manager import commission_manager
 
-# Import the correct sheet name from config
-try:
-    from src.config.settings import DEFAULT_SHEET_NAME
-    sheet_name = DEFAULT_SHEET_NAME
-except ImportError:
-    # Fallback if import fails
-    sheet_name = 'Games'
+@functools.lru_cache(maxsize=1)
+def _sheet_name() -> str:
+    """Resolve the input sheet name from config once, on first fixture write."""
+    try:
+        from src.config.settings import DEFAULT_SHEET_NAME
+        return DEFAULT_SHEET_NAME
+    except ImportError:
+        # Fallback if import fails
+        return 'Games'
+
+
+@contextmanager
+def excel_writer(path: Path) -> Iterator[pd.ExcelWriter]:
+    """Open one openpyxl writer so several fixture sheets share a single workbook."""
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        yield writer
+
+
+def write_games(path: Path, games: pd.DataFrame) -> None:
+    """Write a games fixture to the sheet read by ``process_betting_excel``."""
+    with excel_writer(path) as writer:
+        games.to_excel(writer, sheet_name=_sheet_name(), index=False)
+
+
+@pytest.fixture
+def commission_env(request, monkeypatch):
+    """Patch the global commission manager to a (rate, platform) pair for one test."""
+    rate, platform, *expected = request.param
+    monkeypatch.setattr(commission_manager, 'get_commission_rate', lambda: rate)
+    monkeypatch.setattr(commission_manager, 'get_current_platform', lambda: platform)
+    return (rate, platform, *expected)
 
 
 class TestExcelWorkflowIntegration:
@@ -44,7 +73,7 @@ class TestExcelWorkflowIntegration:
             'Model Margin': [3.5, 7.2, 1.8],
             'Contract Price': [45, 0.40, 52]  # Mixed format: cents and dollars
         })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
+        write_games(input_file, test_data)
         
         weekly_bankroll = 1000.0
         
@@ -63,15 +92,13 @@ class TestExcelWorkflowIntegration:
             'Game', 'Win %', 'Contract Price (¢)', 'Decision', 
             'EV Percentage', 'Bet Amount', 'Final Recommendation'
         ]
-        for col in required_output_columns:
-            assert col in results_df.columns
+        missing = set(required_output_columns) - set(results_df.columns)
+        assert not missing, missing
         
         # Verify data transformation occurred correctly
         # Results are sorted by EV percentage, so check that all games are present
-        game_names = results_df['Game'].tolist()
-        assert 'Lakers vs Warriors' in game_names
-        assert 'Cowboys vs Giants' in game_names
-        assert 'Yankees vs Red Sox' in game_names
+        expected_games = pd.Series(['Lakers vs Warriors', 'Cowboys vs Giants', 'Yankees vs Red Sox'])
+        assert expected_games.isin(results_df['Game']).all()
         
         # Check data transformation for a specific game
         lakers_row = results_df[results_df['Game'] == 'Lakers vs Warriors'].iloc[0]
@@ -79,8 +106,7 @@ class TestExcelWorkflowIntegration:
         assert lakers_row['Contract Price (¢)'] == 45
         
         # Verify betting decisions were made
-        decisions = results_df['Decision'].unique()
-        assert all(decision in ['BET', 'NO BET'] for decision in decisions)
+        assert results_df['Decision'].isin({'BET', 'NO BET'}).all()
         
         # Verify output file was created
         assert output_file.exists()
@@ -94,7 +120,7 @@ class TestExcelWorkflowIntegration:
             'Model Win Percentage': [75, 80],  # High win rates
             'Contract Price': [0.25, 0.30]     # Low prices = high EV
         })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
+        write_games(input_file, test_data)
         
         weekly_bankroll = 2000.0
         
@@ -110,11 +136,12 @@ class TestExcelWorkflowIntegration:
         assert len(bet_decisions) > 0
         
         # Verify bet amounts are reasonable
-        for _, row in bet_decisions.iterrows():
-            assert row['Bet Amount'] > 0
-            assert row['Bet Percentage'] > 0
-            assert row['Contracts To Buy'] > 0
-            assert row['EV Percentage'] >= 0.10  # Should meet Wharton threshold
+        bet_amounts = bet_decisions['Bet Amount'].to_numpy()
+        assert (bet_amounts > 0).all()
+        assert (bet_amounts <= weekly_bankroll * 0.15 + 1e-6).all()  # 15% per-bet cap
+        assert (bet_decisions['Bet Percentage'].to_numpy() > 0).all()
+        assert (bet_decisions['Contracts To Buy'].to_numpy() > 0).all()
+        assert (bet_decisions['EV Percentage'].to_numpy() >= 0.10).all()  # Should meet Wharton threshold
     
     def test_excel_workflow_with_unprofitable_bets(self, tmp_path: Path) -> None:
         """Test Excel workflow with data that should generate NO BET decisions."""
@@ -125,7 +152,7 @@ class TestExcelWorkflowIntegration:
             'Model Win Percentage': [52, 48],  # Low win rates
             'Contract Price': [0.55, 0.60]     # High prices = low/negative EV
         })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
+        write_games(input_file, test_data)
         
         weekly_bankroll = 1000.0
         
@@ -141,10 +168,9 @@ class TestExcelWorkflowIntegration:
         assert len(no_bet_decisions) > 0
         
         # Verify reasons are provided for NO BET decisions
-        for _, row in no_bet_decisions.iterrows():
-            assert row['Reason'] != ''
-            assert row['Bet Amount'] == 0
-            assert row['Contracts To Buy'] == 0
+        assert (no_bet_decisions['Reason'] != '').all()
+        assert (no_bet_decisions['Bet Amount'].to_numpy() == 0).all()
+        assert (no_bet_decisions['Contracts To Buy'].to_numpy() == 0).all()
     
     def test_excel_workflow_bankroll_allocation(self, tmp_path):
         """Test Excel workflow bankroll allocation with limited funds."""
@@ -155,7 +181,7 @@ class TestExcelWorkflowIntegration:
             'Model Win Percentage': [75, 72, 70, 68],  # All profitable
             'Contract Price': [0.25, 0.28, 0.30, 0.32]
         })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
+        write_games(input_file, test_data)
         
         weekly_bankroll = 500.0  # Limited bankroll
         
@@ -171,84 +197,86 @@ class TestExcelWorkflowIntegration:
         assert total_allocated <= weekly_bankroll
         
         # Should have some bets and some skipped due to insufficient funds
-        final_recommendations = results_df['Final Recommendation'].unique()
-        assert 'BET' in final_recommendations or any('PARTIAL' in rec for rec in final_recommendations)
+        final_recommendations = pd.Series(results_df['Final Recommendation'].unique())
+        assert (final_recommendations == 'BET').any() or final_recommendations.str.contains('PARTIAL').any()
         
         # Verify games are prioritized by EV (highest first)
         bet_rows = results_df[results_df['Cumulative Bet Amount'] > 0]
-        if len(bet_rows) > 1:
-            ev_values = bet_rows['EV Percentage'].tolist()
-            assert ev_values == sorted(ev_values, reverse=True)
+        assert bet_rows['EV Percentage'].is_monotonic_decreasing
     
-    def test_excel_workflow_with_commission_impact(self, tmp_path):
+    @pytest.mark.parametrize(
+        "commission_env",
+        [
+            (0.05, 'High Commission Platform', 1),
+            (0.01, 'Low Commission Platform', 2),
+        ],
+        ids=['high_commission', 'low_commission'],
+        indirect=True,
+    )
+    def test_excel_workflow_with_commission_impact(self, tmp_path, commission_env):
         """Test Excel workflow with commission impact on betting decisions."""
         # Arrange
+        rate, platform, expected_bets = commission_env
         input_file = tmp_path / "commission_test.xlsx"
         test_data = pd.DataFrame({
             'Game': ['Marginal Game 1', 'Marginal Game 2'],
             'Model Win Percentage': [62, 58],  # Marginal win rates
             'Contract Price': [0.42, 0.48]     # Prices that might be affected by commission
         })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
+        write_games(input_file, test_data)
         
         weekly_bankroll = 1000.0
         
-        # Test with different commission rates
         with patch('src.excel_processor.OUTPUT_DIR', tmp_path):
-            # Test with higher commission
-            with patch.object(commission_manager, 'get_commission_rate', return_value=0.05):
-                with patch.object(commission_manager, 'get_current_platform', return_value='High Commission Platform'):
-                    results_high_comm, _ = process_betting_excel(input_file, weekly_bankroll)
-            
-            # Test with lower commission
-            with patch.object(commission_manager, 'get_commission_rate', return_value=0.01):
-                with patch.object(commission_manager, 'get_current_platform', return_value='Low Commission Platform'):
-                    results_low_comm, _ = process_betting_excel(input_file, weekly_bankroll)
+            # Act
+            results_df, _ = process_betting_excel(input_file, weekly_bankroll)
         
         # Assert
-        assert results_high_comm is not None
-        assert results_low_comm is not None
-        
-        # Verify commission data is included
-        assert 'Commission Rate' in results_high_comm.columns
-        assert 'Platform' in results_high_comm.columns
-        assert 'Adjusted Price' in results_high_comm.columns
+        assert results_df is not None
         
-        # Commission should affect betting decisions
-        high_comm_bets = len(results_high_comm[results_high_comm['Decision'] == 'BET'])
-        low_comm_bets = len(results_low_comm[results_low_comm['Decision'] == 'BET'])
+        # Verify commission data is included and reflects the active platform
+        assert (results_df['Commission Rate'] == rate).all()
+        assert (results_df['Platform'] == platform).all()
+        assert 'Adjusted Price' in results_df.columns
         
-        # Lower commission should generally result in more or equal bets
-        assert low_comm_bets >= high_comm_bets
+        # Commission should affect betting decisions: the 58% game clears the
+        # 10% EV threshold only at the lower commission rate
+        assert (results_df['Decision'] == 'BET').sum() == expected_bets
     
     def test_excel_workflow_margin_data_handling(self, tmp_path):
         """Test Excel workflow with and without margin data."""
+        # Both fixtures share one workbook: margin data on the default sheet,
+        # the margin-free variant on a second sheet written by the same writer
+        input_file = tmp_path / "margin_fixtures.xlsx"
+        no_margin_sheet = 'No Margin'
+        
         # Test with margin data
-        input_file_with_margin = tmp_path / "with_margin.xlsx"
         test_data_with_margin = pd.DataFrame({
             'Game': ['Game 1', 'Game 2'],
             'Model Win Percentage': [65, 70],
             'Model Margin': [3.5, 5.2],  # Include margin data
             'Contract Price': [0.35, 0.30]
         })
-        test_data_with_margin.to_excel(input_file_with_margin, sheet_name=sheet_name, index=False)
         
         # Test without margin data
-        input_file_without_margin = tmp_path / "without_margin.xlsx"
         test_data_without_margin = pd.DataFrame({
             'Game': ['Game 3', 'Game 4'],
             'Model Win Percentage': [65, 70],
             'Contract Price': [0.35, 0.30]
             # No margin column
         })
-        test_data_without_margin.to_excel(input_file_without_margin, sheet_name=sheet_name, index=False)
+        with excel_writer(input_file) as writer:
+            test_data_with_margin.to_excel(writer, sheet_name=_sheet_name(), index=False)
+            test_data_without_margin.to_excel(writer, sheet_name=no_margin_sheet, index=False)
         
         weekly_bankroll = 1000.0
         
         with patch('src.excel_processor.OUTPUT_DIR', tmp_path):
             # Act
-            results_with_margin, _ = process_betting_excel(input_file_with_margin, weekly_bankroll)
-            results_without_margin, _ = process_betting_excel(input_file_without_margin, weekly_bankroll)
+            results_with_margin, _ = process_betting_excel(input_file, weekly_bankroll)
+            results_without_margin, _ = process_betting_excel(
+                input_file, weekly_bankroll, sheet_name=no_margin_sheet
+            )
         
         # Assert
         assert results_with_margin is not None
@@ -273,7 +301,7 @@ class TestExcelWorkflowIntegration:
             'Model Win Percentage': [65, 65, 65],
             'Contract Price': [27, 0.27, 85]  # Mixed: cents, dollars, high cents
         })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
+        write_games(input_file, test_data)
         
         weekly_bankroll = 1000.0
         
@@ -286,13 +314,12 @@ class TestExcelWorkflowIntegration:
         
         # Verify price normalization occurred
         # All should be processed correctly regardless of input format
-        for _, row in results_df.iterrows():
-            # Contract prices should be preserved as entered
-            assert row['Contract Price (¢)'] in [27, 0.27, 85]
-            
-            # But calculations should work correctly (check that we have valid decisions)
-            assert row['Decision'] in ['BET', 'NO BET']
-            assert isinstance(row['EV Percentage'], (int, float))
+        # Contract prices should be preserved as entered
+        assert results_df['Contract Price (¢)'].isin([27, 0.27, 85]).all()
+        
+        # But calculations should work correctly (check that we have valid decisions)
+        assert results_df['Decision'].isin({'BET', 'NO BET'}).all()
+        assert pd.api.types.is_numeric_dtype(results_df['EV Percentage'])
     
     def test_excel_workflow_error_handling(self, tmp_path):
         """Test Excel workflow error handling with invalid data."""
@@ -303,7 +330,7 @@ class TestExcelWorkflowIntegration:
             'Model Win Percentage': [65]
             # Missing Contract Price
         })
-        invalid_data.to_excel(input_file_missing_cols, sheet_name=sheet_name, index=False)
+        write_games(input_file_missing_cols, invalid_data)
         
         weekly_bankroll = 1000.0
         
@@ -315,42 +342,40 @@ class TestExcelWorkflowIntegration:
         assert results_df is None
         assert output_file is None
     
-    def test_excel_workflow_performance(self, tmp_path):
-        """Test Excel workflow performance with larger dataset."""
-        # Arrange - Create larger dataset to test performance
+    @pytest.mark.parametrize("num_games,budget", [(10, 1.0), (50, 3.0), (500, 20.0)])
+    def test_excel_workflow_performance(self, tmp_path, num_games, budget):
+        """Test Excel workflow performance scales with dataset size."""
+        # Arrange - Create dataset of the requested size
         input_file = tmp_path / "large_dataset.xlsx"
         
-        # Create 50 games to test performance
-        games = [f'Game {i}' for i in range(1, 51)]
-        win_percentages = [60 + (i % 20) for i in range(50)]  # 60-79%
-        contract_prices = [0.25 + (i % 50) * 0.01 for i in range(50)]  # 0.25-0.74
+        i = np.arange(num_games)
+        games = np.char.add('Game ', (i + 1).astype(str))
+        win_percentages = 60 + (i % 20)  # 60-79%
+        contract_prices = 0.25 + (i % 50) * 0.01  # 0.25-0.74
         
         test_data = pd.DataFrame({
             'Game': games,
             'Model Win Percentage': win_percentages,
             'Contract Price': contract_prices
         })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
+        write_games(input_file, test_data)
         
         weekly_bankroll = 5000.0
         
         with patch('src.excel_processor.OUTPUT_DIR', tmp_path):
             # Act - Time the processing
-            import time
-            start_time = time.time()
+            start_time = time.perf_counter()
             results_df, output_file = process_betting_excel(input_file, weekly_bankroll)
-            end_time = time.time()
-            processing_time = end_time - start_time
+            processing_time = time.perf_counter() - start_time
         
         # Assert
         assert results_df is not None
-        assert len(results_df) == 50
         
-        # Should complete within reasonable time (under 10 seconds for 50 games)
-        assert processing_time < 10.0
+        # Should complete within the size-specific budget
+        assert processing_time < budget
         
         # Verify all games were processed
-        assert len(results_df) == len(test_data)
+        assert len(results_df) == num_games
         
         # Verify bankroll allocation worked correctly
         total_allocated = results_df['Cumulative Bet Amount'].sum()
@@ -369,7 +394,7 @@ class TestExcelOutputGeneration:
             'Model Win Percentage': [70],
             'Contract Price': [0.30]
         })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
+        write_games(input_file, test_data)
         
         weekly_bankroll = 1000.0
         
@@ -381,24 +406,21 @@ class TestExcelOutputGeneration:
         assert output_file is not None
         assert output_file.exists()
         
-        # Read the output file to verify structure
-        with pd.ExcelFile(output_file) as excel_file:
-            sheet_names = excel_file.sheet_names
-            
-            # Should have both Quick_View and Betting_Results sheets
-            assert 'Quick_View' in sheet_names
-            assert 'Betting_Results' in sheet_names
-            
-            # Read both sheets to verify they have data
-            quick_view_df = pd.read_excel(excel_file, sheet_name='Quick_View')
-            betting_results_df = pd.read_excel(excel_file, sheet_name='Betting_Results')
-            
-            assert len(quick_view_df) > 0
-            assert len(betting_results_df) > 0
-            
-            # Quick view should have simplified columns
-            assert 'Game' in quick_view_df.columns
-            assert 'Win %' in quick_view_df.columns or 'Win %' in [col for col in quick_view_df.columns if 'Win' in col]
+        # Read every sheet in one pass to verify structure
+        frames = pd.read_excel(output_file, sheet_name=None)
+        
+        # Should have both Quick_View and Betting_Results sheets
+        assert 'Quick_View' in frames
+        assert 'Betting_Results' in frames
+        
+        # Both sheets should have data
+        quick_view_df = frames['Quick_View']
+        assert len(quick_view_df) > 0
+        assert len(frames['Betting_Results']) > 0
+        
+        # Quick view should have simplified columns
+        assert 'Game' in quick_view_df.columns
+        assert 'Win %' in quick_view_df.columns
     
     def test_excel_output_column_ordering(self, tmp_path):
         """Test that output Excel has logical column ordering."""
@@ -410,7 +432,7 @@ class TestExcelOutputGeneration:
             'Model Margin': [4.5, 2.1],
             'Contract Price': [0.30, 0.35]
         })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
+        write_games(input_file, test_data)
         
         weekly_bankroll = 1000.0
         
@@ -438,99 +460,98 @@ class TestExcelOutputGeneration:
                 assert columns.index(col) > len(columns) // 2  # In latter half
 
 
-class TestExcelWorkflowEdgeCases:
-    """Test Excel workflow edge cases and boundary conditions."""
-    
-    def test_excel_workflow_zero_bankroll(self, tmp_path):
-        """Test Excel workflow with zero bankroll."""
-        # Arrange
-        input_file = tmp_path / "zero_bankroll.xlsx"
-        test_data = pd.DataFrame({
+def _assert_zero_bankroll(results_df: pd.DataFrame | None) -> None:
+    """All BET decisions are skipped and nothing is allocated."""
+    assert results_df is not None
+    bet_rows = results_df[results_df['Decision'] == 'BET']
+    assert bet_rows['Final Recommendation'].str.contains('SKIP|Insufficient').all()
+    assert (results_df['Cumulative Bet Amount'] == 0.0).all()
+
+
+def _assert_single_game(results_df: pd.DataFrame | None) -> None:
+    """The single game is processed into one result row."""
+    assert results_df is not None
+    assert len(results_df) == 1
+    assert results_df.iloc[0]['Game'] == 'Single Game'
+    assert results_df.iloc[0]['Decision'] in ['BET', 'NO BET']
+
+
+def _assert_extreme_values(results_df: pd.DataFrame | None) -> None:
+    """Extreme inputs are handled without crashing or absurd EVs."""
+    assert results_df is not None
+    assert len(results_df) == 4
+    assert results_df['Decision'].isin({'BET', 'NO BET'}).all()
+    assert pd.api.types.is_numeric_dtype(results_df['EV Percentage'])
+    assert (results_df['EV Percentage'] >= -1.0).all()  # Should not be extremely negative
+
+
+def _assert_empty_file(results_df: pd.DataFrame | None) -> None:
+    """An empty workbook is handled gracefully."""
+    assert results_df is None or len(results_df) == 0
+
+
+@dataclass(frozen=True)
+class EdgeCase:
+    """One Excel workflow edge case: input games, bankroll and result checks."""
+    name: str
+    data: dict[str, list[Any]]
+    bankroll: float
+    asserts: Callable[[pd.DataFrame | None], None]
+
+
+EDGE_CASES = [
+    EdgeCase(
+        name='zero_bankroll',
+        data={
             'Game': ['Game 1'],
             'Model Win Percentage': [75],
             'Contract Price': [0.25]
-        })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
-        
-        weekly_bankroll = 0.0
-        
-        with patch('src.excel_processor.OUTPUT_DIR', tmp_path):
-            # Act
-            results_df, output_file = process_betting_excel(input_file, weekly_bankroll)
-        
-        # Assert
-        assert results_df is not None
-        
-        # All final recommendations should be SKIP due to no bankroll
-        for _, row in results_df.iterrows():
-            if row['Decision'] == 'BET':
-                assert 'SKIP' in row['Final Recommendation'] or 'Insufficient' in row['Final Recommendation']
-            assert row['Cumulative Bet Amount'] == 0.0
-    
-    def test_excel_workflow_single_game(self, tmp_path):
-        """Test Excel workflow with single game."""
-        # Arrange
-        input_file = tmp_path / "single_game.xlsx"
-        test_data = pd.DataFrame({
+        },
+        bankroll=0.0,
+        asserts=_assert_zero_bankroll,
+    ),
+    EdgeCase(
+        name='single_game',
+        data={
             'Game': ['Single Game'],
             'Model Win Percentage': [68],
             'Contract Price': [0.32]
-        })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
-        
-        weekly_bankroll = 1000.0
-        
-        with patch('src.excel_processor.OUTPUT_DIR', tmp_path):
-            # Act
-            results_df, output_file = process_betting_excel(input_file, weekly_bankroll)
-        
-        # Assert
-        assert results_df is not None
-        assert len(results_df) == 1
-        assert results_df.iloc[0]['Game'] == 'Single Game'
-        
-        # Should process correctly
-        assert results_df.iloc[0]['Decision'] in ['BET', 'NO BET']
-    
-    def test_excel_workflow_extreme_values(self, tmp_path):
-        """Test Excel workflow with extreme input values."""
-        # Arrange
-        input_file = tmp_path / "extreme_values.xlsx"
-        test_data = pd.DataFrame({
+        },
+        bankroll=1000.0,
+        asserts=_assert_single_game,
+    ),
+    EdgeCase(
+        name='extreme_values',
+        data={
             'Game': ['Very High Win %', 'Very Low Win %', 'Very High Price', 'Very Low Price'],
             'Model Win Percentage': [95, 5, 60, 60],
             'Contract Price': [0.10, 0.10, 0.95, 0.05]
-        })
-        test_data.to_excel(input_file, sheet_name=sheet_name, index=False)
-        
-        weekly_bankroll = 1000.0
-        
-        with patch('src.excel_processor.OUTPUT_DIR', tmp_path):
-            # Act
-            results_df, output_file = process_betting_excel(input_file, weekly_bankroll)
-        
-        # Assert
-        assert results_df is not None
-        assert len(results_df) == 4
-        
-        # Should handle extreme values without crashing
-        for _, row in results_df.iterrows():
-            assert row['Decision'] in ['BET', 'NO BET']
-            assert isinstance(row['EV Percentage'], (int, float))
-            assert row['EV Percentage'] >= -1.0  # Should not be extremely negative
+        },
+        bankroll=1000.0,
+        asserts=_assert_extreme_values,
+    ),
+    EdgeCase(
+        name='empty_file',
+        data={},
+        bankroll=1000.0,
+        asserts=_assert_empty_file,
+    ),
+]
+
+
+class TestExcelWorkflowEdgeCases:
+    """Test Excel workflow edge cases and boundary conditions."""
     
-    def test_excel_workflow_empty_file(self, tmp_path):
-        """Test Excel workflow with empty Excel file."""
+    @pytest.mark.parametrize("case", EDGE_CASES, ids=lambda c: c.name)
+    def test_excel_workflow_edge_case(self, tmp_path, case):
+        """Test Excel workflow handles each edge case without failing."""
         # Arrange
-        input_file = tmp_path / "empty_file.xlsx"
-        empty_data = pd.DataFrame()  # Empty DataFrame
-        empty_data.to_excel(input_file, sheet_name=sheet_name, index=False)
-        
-        weekly_bankroll = 1000.0
+        input_file = tmp_path / f"{case.name}.xlsx"
+        write_games(input_file, pd.DataFrame(case.data))
         
         with patch('src.excel_processor.OUTPUT_DIR', tmp_path):
             # Act
-            results_df, output_file = process_betting_excel(input_file, weekly_bankroll)
+            results_df, output_file = process_betting_excel(input_file, case.bankroll)
         
-        # Assert - Should handle gracefully
-        assert results_df is None or len(results_df) == 0
+        # Assert
+        case.asserts(results_df)
@@ -0,0 +1,111 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+import pytest
+import pandas as pd
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string, get_column_letter
+
+
+@dataclass
+class FakeCell:
+    """Plain stand-in for an openpyxl cell; formatting attributes are set by the code under test."""
+    row: int
+    column: int
+    value: Any = None
+    
+    @property
+    def column_letter(self) -> str:
+        return get_column_letter(self.column)
+
+
+@dataclass
+class FakeWorksheet:
+    """In-memory worksheet supporting the ``cell()``, ``ws["B2"]`` and ``columns`` access used by excel_processor."""
+    cells: Dict[Tuple[int, int], FakeCell] = field(default_factory=dict)
+    column_dimensions: Dict[str, SimpleNamespace] = field(default_factory=lambda: defaultdict(SimpleNamespace))
+    cell_calls: int = 0
+    
+    def cell(self, row: int, column: int) -> FakeCell:
+        self.cell_calls += 1
+        return self.cells.setdefault((row, column), FakeCell(row, column))
+    
+    def __getitem__(self, coordinate: str) -> FakeCell:
+        column_letter, row = coordinate_from_string(coordinate)
+        return self.cell(row=row, column=column_index_from_string(column_letter))
+    
+    @property
+    def columns(self) -> List[List[FakeCell]]:
+        by_column: Dict[int, List[FakeCell]] = defaultdict(list)
+        for (_, column), cell in sorted(self.cells.items()):
+            by_column[column].append(cell)
+        return [by_column[column] for column in sorted(by_column)]
+
+
+@pytest.fixture
+def fake_ws():
+    """Empty in-memory worksheet for formatting and column-width tests."""
+    return FakeWorksheet()
+
+
+# Session-scoped frames below are shared templates: do not mutate them, call .copy()
+# before passing them to anything that writes columns (e.g. apply_bankroll_allocation).
+
+@pytest.fixture(scope="session")
+def sufficient_funds_df():
+    """Two affordable BETs and one NO BET, already sorted by EV."""
+    return pd.DataFrame({
+        'Decision': ['BET', 'BET', 'NO BET'],
+        'Bet Amount': [100.0, 150.0, 0.0],
+        'EV Percentage': [0.15, 0.12, 0.08]
+    })
+
+
+@pytest.fixture(scope="session")
+def insufficient_funds_df():
+    """Three BETs totalling more than a $500 bankroll."""
+    return pd.DataFrame({
+        'Decision': ['BET', 'BET', 'BET'],
+        'Bet Amount': [400.0, 300.0, 200.0],
+        'EV Percentage': [0.15, 0.12, 0.10]
+    })
+
+
+@pytest.fixture(scope="session")
+def small_remaining_df():
+    """A BET leaving $5 of a $1000 bankroll, followed by a larger BET."""
+    return pd.DataFrame({
+        'Decision': ['BET', 'BET'],
+        'Bet Amount': [995.0, 100.0],
+        'EV Percentage': [0.15, 0.12]
+    })
+
+
+@pytest.fixture(scope="session")
+def no_bet_mixed_df():
+    """A single BET surrounded by NO BET rows."""
+    return pd.DataFrame({
+        'Decision': ['NO BET', 'BET', 'NO BET'],
+        'Bet Amount': [0.0, 100.0, 0.0],
+        'EV Percentage': [0.08, 0.15, 0.05]
+    })
+
+
+@pytest.fixture(scope="session")
+def summary_df():
+    """Allocated results with one placed BET, one NO BET and one skipped BET."""
+    return pd.DataFrame({
+        'Decision': ['BET', 'NO BET', 'BET'],
+        'Final Recommendation': ['BET', 'NO BET', 'SKIP - Insufficient Bankroll'],
+        'Cumulative Bet Amount': [100.0, 0.0, 0.0],
+        'Expected Value EV': [15.0, 0.0, 12.0],
+        'Contracts To Buy': [370, 0, 444],
+        'EV Percentage': [0.15, 0.08, 0.12],
+        'Game': ['Game 1', 'Game 2', 'Game 3'],
+        'Adjusted Price': [0.27, 0.48, 0.35]
+    })
@@ -8,12 +8,18 @@ with clear arrange-act-assert structure.
 import pytest
 import sys
 import os
+import warnings
+import numpy as np
 
 from src.betting_framework import (
     normalize_contract_price,
+    normalize_contract_price_array,
     calculate_whole_contracts,
-    user_input_betting_framework
+    calculate_whole_contracts_batch,
+    user_input_betting_framework,
+    user_input_betting_framework_batch
 )
+from src.commission_manager import commission_manager
 
 
 class TestNormalizeContractPrice:
@@ -78,6 +84,33 @@ class TestNormalizeContractPrice:
         
         # Assert
         assert result == expected
+    
+    def test_normalize_contract_price_vectorized(self):
+        """Test normalization across the full dollar and cents range against a NumPy oracle."""
+        # Arrange
+        prices = np.concatenate([np.linspace(0.01, 0.99, 256), np.linspace(1.0, 100.0, 768)])
+        expected = np.where(prices >= 1.0, prices / 100.0, prices)
+        
+        # Act
+        actual = np.fromiter(
+            (normalize_contract_price(p) for p in prices), dtype=np.float64, count=prices.size
+        )
+        
+        # Assert
+        assert np.allclose(actual, expected, atol=1e-10)
+    
+    def test_normalize_contract_price_array(self):
+        """Test array normalization of mixed cents and dollar prices in one call."""
+        # Arrange
+        prices = [27, 45, 99, 1, 0.27, 0.01]
+        expected = [0.27, 0.45, 0.99, 0.01, 0.27, 0.01]
+        
+        # Act
+        result = normalize_contract_price_array(prices)
+        
+        # Assert
+        np.testing.assert_allclose(result, expected)
+        np.testing.assert_array_equal(result, [normalize_contract_price(p) for p in prices])
 
 
 class TestCalculateWholeContracts:
@@ -116,8 +149,8 @@ class TestCalculateWholeContracts:
         expected_unused = 100.0 - expected_actual_amount  # 0.1
         
         assert result['whole_contracts'] == expected_contracts
-        assert abs(result['actual_bet_amount'] - expected_actual_amount) < 0.001
-        assert abs(result['unused_amount'] - expected_unused) < 0.001
+        assert result['actual_bet_amount'] == pytest.approx(expected_actual_amount, abs=0.001)
+        assert result['unused_amount'] == pytest.approx(expected_unused, abs=0.001)
         assert result['adjusted_price'] == expected_adjusted_price
     
     def test_calculate_whole_contracts_insufficient_funds(self):
@@ -151,24 +184,56 @@ class TestCalculateWholeContracts:
         assert result['whole_contracts'] == expected_contracts
         assert result['actual_bet_amount'] == 30.0
         assert result['unused_amount'] == 0.0
+    
+    @pytest.mark.parametrize("commission_per_contract,expected_adjusted_price", [
+        (None, 0.48),   # Falls back to the CommissionManager rate
+        (0.05, 0.50),   # Explicit override wins
+        (0.01, 0.46),
+    ])
+    def test_calculate_whole_contracts_commission_resolution(
+        self, monkeypatch, commission_per_contract, expected_adjusted_price
+    ):
+        """Test that an explicit commission overrides the CommissionManager rate."""
+        # Arrange
+        monkeypatch.setattr(commission_manager, 'get_commission_rate', lambda: 0.03)
+        
+        # Act
+        result = calculate_whole_contracts(100.0, 0.45, commission_per_contract)
+        
+        # Assert
+        assert result['adjusted_price'] == pytest.approx(expected_adjusted_price)
+        assert result['whole_contracts'] == int(100.0 / result['adjusted_price'])
+    
+    def test_calculate_whole_contracts_batch(self):
+        """Test that one batch call matches the scalar calculation for every case."""
+        # Arrange
+        targets = np.array([100.0, 100.0, 0.20, 30.0, 1.0])
+        prices = np.array([0.25, 0.25, 0.25, 0.25, 0.10])
+        commissions = np.array([0.0, 0.05, 0.05, 0.05, 0.0])
+        
+        # Act
+        result = calculate_whole_contracts_batch(targets, prices, commissions)
+        
+        # Assert
+        np.testing.assert_array_equal(result['whole_contracts'], [400, 333, 0, 100, 10])
+        for i, (target, price, commission) in enumerate(zip(targets, prices, commissions)):
+            expected = calculate_whole_contracts(target, price, commission)
+            assert result['whole_contracts'][i] == expected['whole_contracts']
+            assert result['actual_bet_amount'][i] == expected['actual_bet_amount']
+            assert result['unused_amount'][i] == expected['unused_amount']
 
 
 class TestUserInputBettingFramework:
     """Test the main betting framework function."""
     
-    def test_profitable_bet_basic(self):
+    def test_profitable_bet_basic(self, canonical_results):
         """Test a basic profitable bet scenario."""
         # Arrange
-        weekly_bankroll = 1000.0
-        model_win_percentage = 0.65  # 65% win probability
-        contract_price = 0.27  # 27 cents
-        commission_per_contract = 0.0
+        # $1000 bankroll, 65% win probability, 27 cents, no commission
+        key = (1000.0, 0.65, 0.27, 0.0)
         
         # Act
-        result = user_input_betting_framework(
-            weekly_bankroll, model_win_percentage, contract_price, 
-            commission_per_contract=commission_per_contract
-        )
+        result = canonical_results[key]
         
         # Assert
         assert result['decision'] == 'BET'
@@ -238,43 +303,50 @@ class TestUserInputBettingFramework:
         assert 'insufficient' in result['reason']
         assert 'whole contract' in result['reason']
     
-    def test_percentage_format_conversion(self):
+    def test_percentage_format_conversion(self, canonical_results):
         """Test conversion of win percentage from percentage format (>1) to decimal."""
         # Arrange
-        weekly_bankroll = 1000.0
-        model_win_percentage = 65.0  # 65% in percentage format
-        contract_price = 0.27
-        commission_per_contract = 0.0
+        # 65% win probability in percentage format
+        key = (1000.0, 65.0, 0.27, 0.0)
         
         # Act
-        result = user_input_betting_framework(
-            weekly_bankroll, model_win_percentage, contract_price,
-            commission_per_contract=commission_per_contract
-        )
+        result = canonical_results[key]
         
         # Assert
         assert result['decision'] == 'BET'
         assert result['bet_amount'] > 0
         # Should produce same result as 0.65 decimal format
+        assert result == canonical_results[(1000.0, 0.65, 0.27, 0.0)]
     
-    def test_cents_format_price_conversion(self):
+    def test_cents_format_price_conversion(self, canonical_results):
         """Test conversion of contract price from cents format to dollars."""
         # Arrange
-        weekly_bankroll = 1000.0
-        model_win_percentage = 0.65
-        contract_price = 27  # 27 cents in cents format
-        commission_per_contract = 0.0
+        # 27 cents in cents format
+        key = (1000.0, 0.65, 27, 0.0)
         
         # Act
-        result = user_input_betting_framework(
-            weekly_bankroll, model_win_percentage, contract_price,
-            commission_per_contract=commission_per_contract
-        )
+        result = canonical_results[key]
         
         # Assert
         assert result['decision'] == 'BET'
         assert result['normalized_price'] == 0.27
         assert result['bet_amount'] > 0
+        # Should produce same result as 0.27 dollar format
+        assert result == canonical_results[(1000.0, 0.65, 0.27, 0.0)]
+    
+    def test_percentage_and_cents_formats_combined(self, canonical_results):
+        """Test that percentage and cents formats together match all-decimal inputs."""
+        # Arrange
+        decimal_key = (1000.0, 0.68, 0.45, 0.0)
+        formatted_keys = [(1000.0, 68.0, 0.45, 0.0), (1000.0, 68.0, 45, 0.0)]
+        
+        # Act
+        expected = canonical_results[decimal_key]
+        results = [canonical_results[key] for key in formatted_keys]
+        
+        # Assert
+        assert expected['decision'] == 'BET'
+        assert all(result == expected for result in results)
     
     def test_commission_impact_on_ev(self):
         """Test how commission affects EV calculations."""
@@ -316,19 +388,13 @@ class TestUserInputBettingFramework:
             # Bet percentage should not exceed 15%
             assert result['bet_percentage'] <= 15.1  # Small tolerance for rounding
     
-    def test_half_kelly_application(self):
+    def test_half_kelly_application(self, canonical_results):
         """Test that Half Kelly (Wharton optimal) is applied."""
         # Arrange
-        weekly_bankroll = 1000.0
-        model_win_percentage = 0.65
-        contract_price = 0.27
-        commission_per_contract = 0.0
+        key = (1000.0, 0.65, 0.27, 0.0)
         
         # Act
-        result = user_input_betting_framework(
-            weekly_bankroll, model_win_percentage, contract_price,
-            commission_per_contract=commission_per_contract
-        )
+        result = canonical_results[key]
         
         # Assert
         if result['decision'] == 'BET':
@@ -358,19 +424,13 @@ class TestUserInputBettingFramework:
             assert result['whole_contracts_only'] is True
             assert 'unused_amount' in result  # Some money left over due to rounding
     
-    def test_edge_case_zero_commission(self):
+    def test_edge_case_zero_commission(self, canonical_results):
         """Test behavior with zero commission."""
         # Arrange
-        weekly_bankroll = 1000.0
-        model_win_percentage = 0.65
-        contract_price = 0.27
-        commission_per_contract = 0.0
+        key = (1000.0, 0.65, 0.27, 0.0)
         
         # Act
-        result = user_input_betting_framework(
-            weekly_bankroll, model_win_percentage, contract_price,
-            commission_per_contract=commission_per_contract
-        )
+        result = canonical_results[key]
         
         # Assert
         assert result['commission_per_contract'] == 0.0
@@ -413,4 +473,127 @@ class TestUserInputBettingFramework:
         # Assert
         # Should likely result in NO BET due to insufficient funds for one contract
         if result['decision'] == 'NO BET':
-            assert 'insufficient' in result['reason'] or result['ev_percentage'] < 10.0
\ No newline at end of file
+            assert 'insufficient' in result['reason'] or result['ev_percentage'] < 10.0
+
+
+class TestUserInputBettingFrameworkBatch:
+    """Test the vectorized betting framework against the scalar version."""
+    
+    def test_batch_matches_scalar_framework(self):
+        """Test that one batch call reproduces every scalar decision."""
+        # Arrange
+        bankrolls, win_pcts, prices = (grid.ravel() for grid in np.meshgrid(
+            [1.0, 100.0, 1000.0],
+            [0.35, 0.52, 0.65, 0.85, 65.0],
+            [0.05, 0.27, 0.48, 0.75, 27.0],
+            indexing='ij'
+        ))
+        commission = 0.02
+        
+        # Act
+        batch = user_input_betting_framework_batch(
+            bankrolls, win_pcts, prices, commissions_per_contract=commission
+        )
+        scalar = [
+            user_input_betting_framework(
+                bankroll, win_pct, price, commission_per_contract=commission
+            )
+            for bankroll, win_pct, price in zip(bankrolls, win_pcts, prices)
+        ]
+        
+        # Assert
+        expected_decisions = np.array([result['decision'] for result in scalar])
+        expected_contracts = np.array([result.get('contracts_to_buy', 0) for result in scalar])
+        expected_amounts = np.array([result['bet_amount'] for result in scalar])
+        expected_ev = np.array([result['ev_percentage'] for result in scalar])
+        assert 'BET' in expected_decisions and 'NO BET' in expected_decisions
+        np.testing.assert_array_equal(batch['decision'], expected_decisions)
+        np.testing.assert_array_equal(batch['contracts_to_buy'], expected_contracts)
+        np.testing.assert_allclose(batch['bet_amount'], expected_amounts)
+        np.testing.assert_allclose(batch['ev_percentage'], expected_ev)
+    
+    def test_batch_decisions(self):
+        """Test BET/NO BET decisions for a table of cases in one vectorized pass."""
+        # Arrange - (win %, price, expected BET)
+        cases = np.array([
+            (68, 0.45, 1),  # Strong edge
+            (75, 0.20, 1),  # Longshot with large edge
+            (80, 0.10, 1),  # Very cheap contract
+            (52, 0.48, 0),  # EV below 10% threshold
+            (51, 0.49, 0),  # Thin edge
+            (30, 0.50, 0),  # Negative EV
+        ])
+        
+        # Act
+        decisions = user_input_betting_framework_batch(
+            np.full(len(cases), 1000.0), cases[:, 0], cases[:, 1], np.zeros(len(cases))
+        )['decision']
+        
+        # Assert
+        np.testing.assert_array_equal(decisions == 'BET', cases[:, 2].astype(bool))
+    
+    def test_batch_edge_case_inputs(self):
+        """Test that degenerate inputs give NO BET or valid bets without numeric warnings."""
+        # Arrange - (bankroll, win %, price)
+        cases = np.array([
+            (1000.0, 0.0, 0.27),   # 0% win probability
+            (1000.0, 1.0, 0.27),   # 100% win probability
+            (0.0, 0.65, 0.27),     # Empty bankroll
+            (1000.0, 0.65, 0.99),  # Near-certain price
+            (1000.0, 0.65, 0.0),   # Free contract (scalar version divides by zero)
+            (1.0, 0.65, 0.27),     # Too small for one contract
+        ])
+        
+        # Act
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            result = user_input_betting_framework_batch(
+                cases[:, 0], cases[:, 1], cases[:, 2], np.zeros(len(cases))
+            )
+        
+        # Assert
+        assert np.isin(result['decision'], ['BET', 'NO BET']).all()
+        assert result['decision'].tolist() == ['NO BET', 'BET', 'NO BET', 'NO BET', 'NO BET', 'NO BET']
+        assert np.isfinite(result['bet_amount']).all()
+        assert (result['bet_amount'] >= 0).all()
+        assert (result['contracts_to_buy'] >= 0).all()
+    
+    def test_batch_invariant_sweep(self):
+        """Test Wharton invariants across a dense random grid of win percentages and prices."""
+        # Arrange
+        rng = np.random.default_rng(42)
+        size = 10_000
+        bankroll = 1000.0
+        win_pcts = rng.uniform(0.30, 0.95, size)
+        prices = rng.uniform(0.10, 0.90, size)
+        commissions = rng.choice([0.0, 0.01, 0.02], size)
+        
+        # Act
+        result = user_input_betting_framework_batch(bankroll, win_pcts, prices, commissions)
+        
+        # Assert
+        is_bet = result['decision'] == 'BET'
+        assert is_bet.any() and not is_bet.all()
+        assert (result['bet_amount'] <= bankroll * 0.15 + 1e-9).all()
+        assert (result['ev_percentage'][is_bet] >= 10.0).all()
+        assert (result['contracts_to_buy'][is_bet] > 0).all()
+        assert (result['bet_amount'][~is_bet] == 0.0).all()
+        np.testing.assert_allclose(
+            result['bet_amount'], result['contracts_to_buy'] * result['adjusted_price'] * is_bet
+        )
+    
+    def test_batch_broadcasts_scalar_bankroll(self):
+        """Test that a scalar bankroll is applied to every bet in the batch."""
+        # Arrange
+        win_pcts = np.array([0.65, 0.52])
+        prices = np.array([0.27, 0.48])
+        
+        # Act
+        batch = user_input_betting_framework_batch(
+            1000.0, win_pcts, prices, commissions_per_contract=0.0
+        )
+        
+        # Assert
+        assert batch['decision'].tolist() == ['BET', 'NO BET']
+        assert batch['bet_amount'][1] == 0.0
+        assert batch['contracts_to_buy'][1] == 0
@@ -5,15 +5,63 @@ Tests commission calculation, different commission structures, validation,
 and edge case handling with clear arrange-act-assert structure.
 """
 
+import logging
 import pytest
-import sys
-import os
 from pathlib import Path
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch
 
 from src.commission_manager import CommissionManager, commission_manager
 
 
+def _raise(exception_type):
+    """Build a stand-in callable that always raises exception_type."""
+    def raiser(*args, **kwargs):
+        raise exception_type()
+    return raiser
+
+
+@pytest.fixture(autouse=True)
+def _stub_save_settings(request, monkeypatch):
+    """Keep tests from writing config/settings.py unless marked real_save."""
+    if request.node.get_closest_marker("real_save") is None:
+        monkeypatch.setattr(CommissionManager, "_save_settings", lambda self: None)
+
+
+@pytest.fixture
+def fresh_manager():
+    """CommissionManager built from defaults with no saved settings."""
+    CommissionManager._clear_shared_state()
+    with patch.object(Path, 'exists', return_value=False):
+        return CommissionManager()
+
+
+@pytest.fixture(scope="module")
+def default_manager():
+    """Default CommissionManager shared by read-only tests in this module."""
+    CommissionManager._clear_shared_state()
+    with patch.object(Path, 'exists', return_value=False):
+        return CommissionManager()
+
+
+@pytest.fixture(scope="session")
+def config_dirs(tmp_path_factory):
+    """Working directories whose config/settings.py holds each saved-settings variant."""
+    contents = {
+        "predictit": 'CURRENT_COMMISSION_RATE = 0.10\nCURRENT_PLATFORM = "PredictIt"',
+        "none_rate": 'CURRENT_COMMISSION_RATE = None\nCURRENT_PLATFORM = "Robinhood"',
+        "test_platform": 'CURRENT_COMMISSION_RATE = 0.05\nCURRENT_PLATFORM = "Test"',
+        "invalid_format": 'INVALID_FORMAT',
+        "invalid_rate": 'CURRENT_COMMISSION_RATE = 999.99\nCURRENT_PLATFORM = "Test"',
+    }
+    dirs = {}
+    for name, content in contents.items():
+        work_dir = tmp_path_factory.mktemp(name)
+        (work_dir / "config").mkdir()
+        (work_dir / "config" / "settings.py").write_text(content)
+        dirs[name] = work_dir
+    return dirs
+
+
 class TestCommissionManagerInitialization:
     """Test CommissionManager initialization and default settings."""
     
@@ -28,10 +76,9 @@ class TestCommissionManagerInitialization:
             manager = CommissionManager()
         
         # Assert
-        assert manager.get_commission_rate() == CommissionManager.DEFAULT_COMMISSION_RATE
-        assert manager.get_current_platform() == CommissionManager.DEFAULT_PLATFORM
-        assert manager.get_commission_rate() == 0.02
-        assert manager.get_current_platform() == "Robinhood"
+        rate, platform = manager.get_commission_rate(), manager.get_current_platform()
+        assert rate == CommissionManager.DEFAULT_COMMISSION_RATE == 0.02
+        assert platform == CommissionManager.DEFAULT_PLATFORM == "Robinhood"
     
     def test_initialization_with_shared_state(self):
         """Test initialization using existing shared state."""
@@ -46,12 +93,10 @@ class TestCommissionManagerInitialization:
         assert manager.get_commission_rate() == 0.05
         assert manager.get_current_platform() == "Kalshi"
     
-    @patch('commission_manager.Path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data='CURRENT_COMMISSION_RATE = 0.10\nCURRENT_PLATFORM = "PredictIt"')
-    def test_initialization_loads_saved_settings(self, mock_file, mock_exists):
+    def test_initialization_loads_saved_settings(self, config_dirs, monkeypatch):
         """Test initialization loads settings from config file."""
         # Arrange
-        mock_exists.return_value = True
+        monkeypatch.chdir(config_dirs["predictit"])
         
         # Act
         manager = CommissionManager()
@@ -60,12 +105,10 @@ class TestCommissionManagerInitialization:
         assert manager.get_commission_rate() == 0.10
         assert manager.get_current_platform() == "PredictIt"
     
-    @patch('commission_manager.Path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data='CURRENT_COMMISSION_RATE = None\nCURRENT_PLATFORM = "Robinhood"')
-    def test_initialization_handles_none_rate(self, mock_file, mock_exists):
+    def test_initialization_handles_none_rate(self, config_dirs, monkeypatch):
         """Test initialization handles None rate in config file."""
         # Arrange
-        mock_exists.return_value = True
+        monkeypatch.chdir(config_dirs["none_rate"])
         
         # Act
         manager = CommissionManager()
@@ -82,30 +125,23 @@ class TestCommissionRateManagement:
         """Clear shared state before each test."""
         CommissionManager._clear_shared_state()
     
-    def test_get_commission_rate_default(self):
+    def test_get_commission_rate_default(self, fresh_manager):
         """Test getting default commission rate."""
-        # Arrange & Act
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-            rate = manager.get_commission_rate()
+        # Act
+        rate = fresh_manager.get_commission_rate()
         
         # Assert
         assert rate == 0.02
         assert isinstance(rate, float)
     
-    def test_set_commission_rate_valid(self):
+    def test_set_commission_rate_valid(self, fresh_manager):
         """Test setting a valid commission rate."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        with patch.object(manager, '_save_settings'):
-            # Act
-            manager.set_commission_rate(0.05, "Custom Platform")
+        # Act
+        fresh_manager.set_commission_rate(0.05, "Custom Platform")
         
         # Assert
-        assert manager.get_commission_rate() == 0.05
-        assert manager.get_current_platform() == "Custom Platform"
+        assert fresh_manager.get_commission_rate() == 0.05
+        assert fresh_manager.get_current_platform() == "Custom Platform"
     
     def test_set_commission_rate_updates_shared_state(self):
         """Test that setting commission rate updates shared state for new instances."""
@@ -113,61 +149,37 @@ class TestCommissionRateManagement:
         with patch.object(Path, 'exists', return_value=False):
             manager1 = CommissionManager()
         
-        with patch.object(manager1, '_save_settings'):
-            # Act
-            manager1.set_commission_rate(0.08)
-            
-            # Create new instance after shared state is updated
-            manager2 = CommissionManager()
+        # Act
+        manager1.set_commission_rate(0.08)
+        
+        # Create new instance after shared state is updated
+        manager2 = CommissionManager()
         
         # Assert
         assert manager2.get_commission_rate() == 0.08
         assert CommissionManager._shared_commission_rate == 0.08
     
-    def test_set_commission_rate_invalid_type(self):
-        """Test setting commission rate with invalid type raises TypeError."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        # Act & Assert
-        with pytest.raises(TypeError, match="Commission rate must be a number"):
-            manager.set_commission_rate("invalid")  # type: ignore[arg-type]
-    
-    def test_set_commission_rate_negative_value(self):
-        """Test setting negative commission rate raises ValueError."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        # Act & Assert
-        with pytest.raises(ValueError, match="Commission rate must be between"):
-            manager.set_commission_rate(-0.01)
-    
-    def test_set_commission_rate_too_high(self):
-        """Test setting commission rate above maximum raises ValueError."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
+    @pytest.mark.parametrize("rate,expected_exception,message", [
+        (-0.01, ValueError, "Commission rate must be between"),
+        (1.01, ValueError, "Commission rate must be between"),
+        ("invalid", TypeError, "Commission rate must be a number"),
+        (None, TypeError, "Commission rate must be a number"),
+        ([0.05], TypeError, "Commission rate must be a number"),
+    ])
+    def test_set_commission_rate_rejects_invalid(self, fresh_manager, rate, expected_exception, message):
+        """Test setting an out-of-range or non-numeric commission rate raises."""
         # Act & Assert
-        with pytest.raises(ValueError, match="Commission rate must be between"):
-            manager.set_commission_rate(1.01)
+        with pytest.raises(expected_exception, match=message):
+            fresh_manager.set_commission_rate(rate)  # type: ignore[arg-type]
     
-    def test_set_commission_rate_boundary_values(self):
-        """Test setting commission rate at boundary values."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
+    @pytest.mark.parametrize("rate", [0.00, 0.50, 1.00])
+    def test_set_commission_rate_boundary_values(self, fresh_manager, rate):
+        """Test setting commission rate at and between the boundary values."""
+        # Act
+        fresh_manager.set_commission_rate(rate)
         
-        with patch.object(manager, '_save_settings'):
-            # Act & Assert - Minimum boundary
-            manager.set_commission_rate(0.00)
-            assert manager.get_commission_rate() == 0.00
-            
-            # Act & Assert - Maximum boundary
-            manager.set_commission_rate(1.00)
-            assert manager.get_commission_rate() == 1.00
+        # Assert
+        assert fresh_manager.get_commission_rate() == rate
 
 
 class TestPlatformPresets:
@@ -177,31 +189,24 @@ class TestPlatformPresets:
         """Clear shared state before each test."""
         CommissionManager._clear_shared_state()
     
-    def test_get_platform_presets(self):
+    def test_get_platform_presets(self, default_manager):
         """Test getting platform presets returns correct structure."""
-        # Arrange & Act
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-            presets = manager.get_platform_presets()
+        # Act
+        presets = default_manager.get_platform_presets()
         
         # Assert
         assert isinstance(presets, dict)
-        assert "Robinhood" in presets
-        assert "Kalshi" in presets
-        assert "PredictIt" in presets
-        assert "Polymarket" in presets
+        assert {"Robinhood", "Kalshi", "PredictIt", "Polymarket"} <= presets.keys()
         assert "Custom" not in presets  # Should be excluded (value is None)
         assert presets["Robinhood"] == 0.02
         assert presets["Kalshi"] == 0.00
         assert presets["PredictIt"] == 0.10
     
-    def test_get_platform_presets_returns_copy(self):
+    def test_get_platform_presets_returns_copy(self, default_manager):
         """Test that platform presets returns a copy to prevent external modification."""
-        # Arrange & Act
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-            presets1 = manager.get_platform_presets()
-            presets2 = manager.get_platform_presets()
+        # Act
+        presets1 = default_manager.get_platform_presets()
+        presets2 = default_manager.get_platform_presets()
         
         # Modify one copy
         presets1["Robinhood"] = 999.99
@@ -210,53 +215,30 @@ class TestPlatformPresets:
         assert presets2["Robinhood"] == 0.02  # Should be unchanged
         assert presets1 is not presets2  # Should be different objects
     
-    def test_set_platform_valid(self):
-        """Test setting a valid platform preset."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        with patch.object(manager, '_save_settings'):
-            # Act
-            manager.set_platform("PredictIt")
-        
-        # Assert
-        assert manager.get_commission_rate() == 0.10
-        assert manager.get_current_platform() == "PredictIt"
-    
-    def test_set_platform_kalshi_zero_commission(self):
-        """Test setting Kalshi platform with zero commission."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        with patch.object(manager, '_save_settings'):
-            # Act
-            manager.set_platform("Kalshi")
+    @pytest.mark.parametrize("platform,expected_rate", [
+        ("Robinhood", 0.02),   # Fixed per contract
+        ("Kalshi", 0.00),      # Zero commission
+        ("PredictIt", 0.10),   # Percentage based, 10% represented as 0.10
+        ("Polymarket", 0.00),  # Gas fees only
+    ])
+    def test_set_platform_applies_preset(self, fresh_manager, platform, expected_rate):
+        """Test setting a platform preset applies its commission rate."""
+        # Act
+        fresh_manager.set_platform(platform)
         
         # Assert
-        assert manager.get_commission_rate() == 0.00
-        assert manager.get_current_platform() == "Kalshi"
+        assert fresh_manager.get_commission_rate() == expected_rate
+        assert fresh_manager.get_current_platform() == platform
     
-    def test_set_platform_invalid(self):
-        """Test setting invalid platform raises ValueError."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        # Act & Assert
-        with pytest.raises(ValueError, match="Platform 'InvalidPlatform' not found"):
-            manager.set_platform("InvalidPlatform")
-    
-    def test_set_platform_custom_raises_error(self):
-        """Test setting platform to 'Custom' raises ValueError."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
+    @pytest.mark.parametrize("platform,message", [
+        ("InvalidPlatform", "Platform 'InvalidPlatform' not found"),
+        ("Custom", "Cannot set platform to 'Custom'"),
+    ])
+    def test_set_platform_rejects_invalid(self, fresh_manager, platform, message):
+        """Test setting an unknown platform or 'Custom' raises ValueError."""
         # Act & Assert
-        with pytest.raises(ValueError, match="Cannot set platform to 'Custom'"):
-            manager.set_platform("Custom")
+        with pytest.raises(ValueError, match=message):
+            fresh_manager.set_platform(platform)
     
     def test_set_platform_updates_shared_state(self):
         """Test that setting platform updates shared state for new instances."""
@@ -264,12 +246,11 @@ class TestPlatformPresets:
         with patch.object(Path, 'exists', return_value=False):
             manager1 = CommissionManager()
         
-        with patch.object(manager1, '_save_settings'):
-            # Act
-            manager1.set_platform("PredictIt")
-            
-            # Create new instance after shared state is updated
-            manager2 = CommissionManager()
+        # Act
+        manager1.set_platform("PredictIt")
+        
+        # Create new instance after shared state is updated
+        manager2 = CommissionManager()
         
         # Assert
         assert manager2.get_commission_rate() == 0.10
@@ -283,66 +264,31 @@ class TestValidation:
         """Clear shared state before each test."""
         CommissionManager._clear_shared_state()
     
-    def test_validate_commission_rate_valid_float(self):
-        """Test validation accepts valid float values."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        # Act & Assert - Should not raise exception
-        manager._validate_commission_rate(0.05)
-        manager._validate_commission_rate(0.00)
-        manager._validate_commission_rate(1.00)
-    
-    def test_validate_commission_rate_valid_int(self):
-        """Test validation accepts valid integer values."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
+    @pytest.mark.parametrize("rate", [
+        pytest.param(0.05, id="float"),
+        pytest.param(0.00, id="float_min"),
+        pytest.param(1.00, id="float_max"),
+        pytest.param(0, id="int_min"),
+        pytest.param(1, id="int_max"),
+    ])
+    def test_validate_commission_rate_accepts(self, default_manager, rate):
+        """Test validation accepts int and float values within range."""
         # Act & Assert - Should not raise exception
-        manager._validate_commission_rate(0)
-        manager._validate_commission_rate(1)
-    
-    def test_validate_commission_rate_invalid_string(self):
-        """Test validation rejects string values."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        # Act & Assert
-        with pytest.raises(TypeError, match="Commission rate must be a number, got str"):
-            manager._validate_commission_rate("0.05")
-    
-    def test_validate_commission_rate_invalid_none(self):
-        """Test validation rejects None values."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        # Act & Assert
-        with pytest.raises(TypeError, match="Commission rate must be a number, got NoneType"):
-            manager._validate_commission_rate(None)
-    
-    def test_validate_commission_rate_below_minimum(self):
-        """Test validation rejects values below minimum."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
+        default_manager._validate_commission_rate(rate)
+    
+    @pytest.mark.parametrize("rate,expected_exception,message", [
+        pytest.param("0.05", TypeError, "Commission rate must be a number, got str", id="string"),
+        pytest.param(None, TypeError, "Commission rate must be a number, got NoneType", id="none"),
+        pytest.param(-0.01, ValueError,
+                     "Commission rate must be between \\$0.00 and \\$1.00, got \\$-0.01", id="below_minimum"),
+        pytest.param(1.01, ValueError,
+                     "Commission rate must be between \\$0.00 and \\$1.00, got \\$1.01", id="above_maximum"),
+    ])
+    def test_validate_commission_rate_rejects(self, default_manager, rate, expected_exception, message):
+        """Test validation rejects non-numeric and out-of-range values."""
         # Act & Assert
-        with pytest.raises(ValueError, match="Commission rate must be between \\$0.00 and \\$1.00, got \\$-0.01"):
-            manager._validate_commission_rate(-0.01)
-    
-    def test_validate_commission_rate_above_maximum(self):
-        """Test validation rejects values above maximum."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        # Act & Assert
-        with pytest.raises(ValueError, match="Commission rate must be between \\$0.00 and \\$1.00, got \\$1.01"):
-            manager._validate_commission_rate(1.01)
+        with pytest.raises(expected_exception, match=message):
+            default_manager._validate_commission_rate(rate)
 
 
 class TestResetFunctionality:
@@ -352,24 +298,18 @@ class TestResetFunctionality:
         """Clear shared state before each test."""
         CommissionManager._clear_shared_state()
     
-    def test_reset_to_default(self):
+    def test_reset_to_default(self, fresh_manager):
         """Test resetting to default settings."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
+        # Arrange - Set custom values first
+        fresh_manager.set_commission_rate(0.15, "Custom")
         
-        with patch.object(manager, '_save_settings'):
-            # Set custom values first
-            manager.set_commission_rate(0.15, "Custom")
-            
-            # Act
-            manager.reset_to_default()
+        # Act
+        fresh_manager.reset_to_default()
         
         # Assert
-        assert manager.get_commission_rate() == CommissionManager.DEFAULT_COMMISSION_RATE
-        assert manager.get_current_platform() == CommissionManager.DEFAULT_PLATFORM
-        assert manager.get_commission_rate() == 0.02
-        assert manager.get_current_platform() == "Robinhood"
+        rate, platform = fresh_manager.get_commission_rate(), fresh_manager.get_current_platform()
+        assert rate == CommissionManager.DEFAULT_COMMISSION_RATE == 0.02
+        assert platform == CommissionManager.DEFAULT_PLATFORM == "Robinhood"
     
     def test_reset_to_default_updates_shared_state(self):
         """Test that reset updates shared state for all instances."""
@@ -378,12 +318,11 @@ class TestResetFunctionality:
             manager1 = CommissionManager()
             manager2 = CommissionManager()
         
-        with patch.object(manager1, '_save_settings'):
-            # Set custom values first
-            manager1.set_commission_rate(0.15, "Custom")
-            
-            # Act
-            manager1.reset_to_default()
+        # Set custom values first
+        manager1.set_commission_rate(0.15, "Custom")
+        
+        # Act
+        manager1.reset_to_default()
         
         # Assert
         assert manager2.get_commission_rate() == 0.02
@@ -397,37 +336,27 @@ class TestCommissionInfo:
         """Clear shared state before each test."""
         CommissionManager._clear_shared_state()
     
-    def test_get_commission_info_structure(self):
+    def test_get_commission_info_structure(self, default_manager):
         """Test commission info returns correct structure."""
-        # Arrange & Act
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-            info = manager.get_commission_info()
+        # Act
+        info = default_manager.get_commission_info()
         
         # Assert
         assert isinstance(info, dict)
-        assert "current_platform" in info
-        assert "current_rate" in info
-        assert "available_platforms" in info
-        assert "platform_presets" in info
+        assert {"current_platform", "current_rate", "available_platforms", "platform_presets"} <= info.keys()
     
-    def test_get_commission_info_content(self):
+    def test_get_commission_info_content(self, fresh_manager):
         """Test commission info contains correct content."""
         # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
+        fresh_manager.set_platform("PredictIt")
         
-        with patch.object(manager, '_save_settings'):
-            manager.set_platform("PredictIt")
-            
-            # Act
-            info = manager.get_commission_info()
+        # Act
+        info = fresh_manager.get_commission_info()
         
         # Assert
         assert info["current_platform"] == "PredictIt"
         assert info["current_rate"] == 0.10
-        assert "Robinhood" in info["available_platforms"]
-        assert "Custom" in info["available_platforms"]
+        assert {"Robinhood", "Custom"} <= set(info["available_platforms"])
         assert info["platform_presets"]["Robinhood"] == 0.02
         assert "Custom" not in info["platform_presets"]  # Should be excluded
 
@@ -439,47 +368,28 @@ class TestStringRepresentation:
         """Clear shared state before each test."""
         CommissionManager._clear_shared_state()
     
-    def test_str_representation(self):
+    def test_str_representation(self, default_manager):
         """Test __str__ method returns readable format."""
-        # Arrange & Act
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-            str_repr = str(manager)
+        # Act
+        str_repr = str(default_manager)
         
         # Assert
         assert "CommissionManager" in str_repr
         assert "Robinhood" in str_repr
         assert "$0.02" in str_repr
     
-    def test_repr_representation(self):
+    def test_repr_representation(self, default_manager):
         """Test __repr__ method returns detailed format."""
-        # Arrange & Act
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-            repr_str = repr(manager)
+        # Act
+        repr_str = repr(default_manager)
         
         # Assert
         assert "CommissionManager" in repr_str
         assert "platform='Robinhood'" in repr_str
         assert "rate=0.02" in repr_str
-    
-    def test_str_with_custom_settings(self):
-        """Test string representation with custom settings."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        with patch.object(manager, '_save_settings'):
-            manager.set_commission_rate(0.08, "Custom Platform")
-            
-            # Act
-            str_repr = str(manager)
-        
-        # Assert
-        assert "Custom Platform" in str_repr
-        assert "$0.08" in str_repr
 
 
+@pytest.mark.real_save
 class TestPersistence:
     """Test settings persistence functionality."""
     
@@ -487,12 +397,10 @@ class TestPersistence:
         """Clear shared state before each test."""
         CommissionManager._clear_shared_state()
     
-    @patch('commission_manager.Path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data='CURRENT_COMMISSION_RATE = 0.05\nCURRENT_PLATFORM = "Test"')
-    def test_load_settings_success(self, mock_file, mock_exists):
+    def test_load_settings_success(self, config_dirs, monkeypatch):
         """Test successful loading of settings from file."""
         # Arrange
-        mock_exists.return_value = True
+        monkeypatch.chdir(config_dirs["test_platform"])
         
         # Act
         manager = CommissionManager()
@@ -501,12 +409,10 @@ class TestPersistence:
         assert manager.get_commission_rate() == 0.05
         assert manager.get_current_platform() == "Test"
     
-    @patch('commission_manager.Path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data='INVALID_FORMAT')
-    def test_load_settings_invalid_format(self, mock_file, mock_exists):
+    def test_load_settings_invalid_format(self, config_dirs, monkeypatch):
         """Test loading settings with invalid file format falls back to defaults."""
         # Arrange
-        mock_exists.return_value = True
+        monkeypatch.chdir(config_dirs["invalid_format"])
         
         # Act
         manager = CommissionManager()
@@ -515,12 +421,10 @@ class TestPersistence:
         assert manager.get_commission_rate() == CommissionManager.DEFAULT_COMMISSION_RATE
         assert manager.get_current_platform() == CommissionManager.DEFAULT_PLATFORM
     
-    @patch('commission_manager.Path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data='CURRENT_COMMISSION_RATE = 999.99\nCURRENT_PLATFORM = "Test"')
-    def test_load_settings_invalid_rate(self, mock_file, mock_exists):
+    def test_load_settings_invalid_rate(self, config_dirs, monkeypatch):
         """Test loading settings with invalid rate falls back to defaults."""
         # Arrange
-        mock_exists.return_value = True
+        monkeypatch.chdir(config_dirs["invalid_rate"])
         
         # Act
         manager = CommissionManager()
@@ -529,12 +433,11 @@ class TestPersistence:
         assert manager.get_commission_rate() == CommissionManager.DEFAULT_COMMISSION_RATE
         assert manager.get_current_platform() == CommissionManager.DEFAULT_PLATFORM
     
-    @patch('commission_manager.Path.exists')
-    @patch('builtins.open', side_effect=FileNotFoundError())
-    def test_load_settings_file_not_found(self, mock_file, mock_exists):
+    def test_load_settings_file_not_found(self, config_dirs, monkeypatch):
         """Test loading settings when file cannot be read falls back to defaults."""
         # Arrange
-        mock_exists.return_value = True
+        monkeypatch.chdir(config_dirs["predictit"])
+        monkeypatch.setattr("builtins.open", _raise(FileNotFoundError))
         
         # Act
         manager = CommissionManager()
@@ -543,47 +446,42 @@ class TestPersistence:
         assert manager.get_commission_rate() == CommissionManager.DEFAULT_COMMISSION_RATE
         assert manager.get_current_platform() == CommissionManager.DEFAULT_PLATFORM
     
-    @patch('commission_manager.Path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data='CURRENT_COMMISSION_RATE = 0.05\nCURRENT_PLATFORM = "Test"')
-    def test_save_settings_success(self, mock_file, mock_exists):
+    def test_save_settings_success(self, tmp_path, monkeypatch):
         """Test successful saving of settings to file."""
         # Arrange
-        mock_exists.return_value = True
+        settings_file = tmp_path / "config" / "settings.py"
+        settings_file.parent.mkdir()
+        settings_file.write_text('CURRENT_COMMISSION_RATE = 0.05\nCURRENT_PLATFORM = "Test"')
+        monkeypatch.chdir(tmp_path)
         manager = CommissionManager()
         
         # Act
         manager.set_commission_rate(0.08, "New Platform")
         
         # Assert
-        # Verify file was written to
-        mock_file.assert_called()
-        handle = mock_file()
-        handle.write.assert_called()
+        content = settings_file.read_text()
+        assert "CURRENT_COMMISSION_RATE = 0.08" in content
+        assert 'CURRENT_PLATFORM = "New Platform"' in content
     
-    @patch('commission_manager.Path.exists')
-    def test_save_settings_no_file(self, mock_exists):
+    def test_save_settings_no_file(self, tmp_path, monkeypatch):
         """Test saving settings when config file doesn't exist."""
         # Arrange
-        mock_exists.return_value = False
-        
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
+        monkeypatch.chdir(tmp_path)
+        manager = CommissionManager()
         
         # Act - Should not raise exception
         manager.set_commission_rate(0.08)
         
         # Assert - Should complete without error
         assert manager.get_commission_rate() == 0.08
+        assert not (tmp_path / "config").exists()
     
-    @patch('commission_manager.Path.exists')
-    @patch('builtins.open', side_effect=PermissionError())
-    def test_save_settings_permission_error(self, mock_file, mock_exists):
+    def test_save_settings_permission_error(self, config_dirs, monkeypatch):
         """Test saving settings handles permission errors gracefully."""
         # Arrange
-        mock_exists.return_value = True
-        
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
+        monkeypatch.chdir(config_dirs["test_platform"])
+        manager = CommissionManager()
+        monkeypatch.setattr("builtins.open", _raise(PermissionError))
         
         # Act - Should not raise exception
         manager.set_commission_rate(0.08)
@@ -605,12 +503,11 @@ class TestEdgeCases:
         with patch.object(Path, 'exists', return_value=False):
             manager1 = CommissionManager()
         
-        with patch.object(manager1, '_save_settings'):
-            manager1.set_commission_rate(0.07, "Shared")
-            
-            # Create new instances after shared state is updated
-            manager2 = CommissionManager()
-            manager3 = CommissionManager()
+        manager1.set_commission_rate(0.07, "Shared")
+        
+        # Create new instances after shared state is updated
+        manager2 = CommissionManager()
+        manager3 = CommissionManager()
         
         # Assert
         assert manager2.get_commission_rate() == 0.07
@@ -618,31 +515,27 @@ class TestEdgeCases:
         assert manager2.get_current_platform() == "Shared"
         assert manager3.get_current_platform() == "Shared"
     
-    def test_commission_rate_precision(self):
+    @pytest.mark.parametrize("rate", [0.123456789, 0.0001, 1e-5, 1e-10])
+    def test_commission_rate_precision(self, fresh_manager, rate):
         """Test commission rate handles floating point precision correctly."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        with patch.object(manager, '_save_settings'):
-            # Act
-            manager.set_commission_rate(0.123456789)
+        # Act
+        fresh_manager.set_commission_rate(rate)
         
         # Assert
-        assert manager.get_commission_rate() == 0.123456789
+        assert fresh_manager.get_commission_rate() == rate
     
-    def test_platform_name_with_special_characters(self):
+    @pytest.mark.parametrize("platform", [
+        "Platform-Name_123 (Test)",
+        "Café Exchange",
+        "P" * 100,
+    ])
+    def test_platform_name_with_special_characters(self, fresh_manager, platform):
         """Test platform names with special characters."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        with patch.object(manager, '_save_settings'):
-            # Act
-            manager.set_commission_rate(0.05, "Platform-Name_123 (Test)")
+        # Act
+        fresh_manager.set_commission_rate(0.05, platform)
         
         # Assert
-        assert manager.get_current_platform() == "Platform-Name_123 (Test)"
+        assert fresh_manager.get_current_platform() == platform
     
     def test_clear_shared_state_functionality(self):
         """Test clearing shared state works correctly."""
@@ -657,45 +550,32 @@ class TestEdgeCases:
         assert CommissionManager._shared_commission_rate is None
         assert CommissionManager._shared_platform is None
     
-    def test_logging_failures_dont_break_functionality(self):
+    def test_logging_failures_dont_break_functionality(self, fresh_manager, monkeypatch):
         """Test that logging failures don't break core functionality."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
+        # Arrange - Make the module logger raise on info()
+        logger = logging.getLogger(CommissionManager.__module__)
+        monkeypatch.setattr(logger, "info", _raise(RuntimeError))
         
-        # Mock logger to raise exception
-        with patch('commission_manager.logger') as mock_logger:
-            mock_logger.info.side_effect = Exception("Logging failed")
-            
-            with patch.object(manager, '_save_settings'):
-                # Act - Should not raise exception despite logging failure
-                manager.set_commission_rate(0.06, "Test Platform")
+        # Act - Should not raise exception despite logging failure
+        fresh_manager.set_commission_rate(0.06, "Test Platform")
         
         # Assert - Core functionality should still work
-        assert manager.get_commission_rate() == 0.06
-        assert manager.get_current_platform() == "Test Platform"
+        assert fresh_manager.get_commission_rate() == 0.06
+        assert fresh_manager.get_current_platform() == "Test Platform"
 
 
 class TestGlobalInstance:
     """Test the global commission_manager instance."""
     
-    def test_global_instance_exists(self):
+    def test_global_instance(self):
         """Test that global commission_manager instance exists and is functional."""
-        # Act & Assert
-        assert commission_manager is not None
-        assert isinstance(commission_manager, CommissionManager)
-        assert hasattr(commission_manager, 'get_commission_rate')
-        assert hasattr(commission_manager, 'set_commission_rate')
-        assert hasattr(commission_manager, 'get_current_platform')
-    
-    def test_global_instance_functionality(self):
-        """Test that global instance has working functionality."""
         # Act
         rate = commission_manager.get_commission_rate()
         platform = commission_manager.get_current_platform()
         presets = commission_manager.get_platform_presets()
         
         # Assert
+        assert isinstance(commission_manager, CommissionManager)
         assert isinstance(rate, (int, float))
         assert isinstance(platform, str)
         assert isinstance(presets, dict)
@@ -711,99 +591,49 @@ class TestCommissionStructures:
         """Clear shared state before each test."""
         CommissionManager._clear_shared_state()
     
-    def test_zero_commission_structure(self):
-        """Test zero commission structure (like Kalshi)."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        with patch.object(manager, '_save_settings'):
-            # Act
-            manager.set_platform("Kalshi")
-        
-        # Assert
-        assert manager.get_commission_rate() == 0.00
-        assert manager.get_current_platform() == "Kalshi"
-    
-    def test_percentage_based_commission_structure(self):
-        """Test percentage-based commission structure (like PredictIt)."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        with patch.object(manager, '_save_settings'):
-            # Act
-            manager.set_platform("PredictIt")
-        
-        # Assert
-        assert manager.get_commission_rate() == 0.10  # 10% represented as 0.10
-        assert manager.get_current_platform() == "PredictIt"
-    
-    def test_fixed_per_contract_commission_structure(self):
-        """Test fixed per-contract commission structure (like Robinhood)."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        with patch.object(manager, '_save_settings'):
-            # Act
-            manager.set_platform("Robinhood")
+    @pytest.mark.parametrize("rate,platform,expected_str", [
+        (0.05, "Custom Broker", "CommissionManager(Custom Broker: $0.05)"),
+        (0.08, "Custom Platform", "CommissionManager(Custom Platform: $0.08)"),
+        (0.50, "High Commission Platform", "CommissionManager(High Commission Platform: $0.50)"),
+    ])
+    def test_custom_commission_structure(self, fresh_manager, rate, platform, expected_str):
+        """Test custom commission structures for unlisted platforms, including str output."""
+        # Act
+        fresh_manager.set_commission_rate(rate, platform)
         
         # Assert
-        assert manager.get_commission_rate() == 0.02  # $0.02 per contract
-        assert manager.get_current_platform() == "Robinhood"
+        assert fresh_manager.get_commission_rate() == rate
+        assert fresh_manager.get_current_platform() == platform
+        assert str(fresh_manager) == expected_str
     
-    def test_custom_commission_structure(self):
-        """Test custom commission structure for unlisted platforms."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
-        
-        with patch.object(manager, '_save_settings'):
-            # Act
-            manager.set_commission_rate(0.075, "Custom Broker")
+    def test_custom_commission_structure_sub_cent_rate(self, fresh_manager):
+        """Test that a sub-cent custom rate round-trips unchanged."""
+        # Act
+        fresh_manager.set_commission_rate(0.075, "Custom Broker")
         
         # Assert
-        assert manager.get_commission_rate() == 0.075
-        assert manager.get_current_platform() == "Custom Broker"
+        assert fresh_manager.get_commission_rate() == 0.075
+        assert fresh_manager.get_current_platform() == "Custom Broker"
+        assert "Custom Broker" in str(fresh_manager)
     
-    def test_high_commission_structure(self):
-        """Test high commission structure at upper boundary."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
+    def test_commission_structure_switching(self, fresh_manager):
+        """Test switching between different commission structures."""
+        # Act - Switch through different structures
+        fresh_manager.set_platform("Robinhood")  # Fixed per contract
+        robinhood_rate = fresh_manager.get_commission_rate()
         
-        with patch.object(manager, '_save_settings'):
-            # Act
-            manager.set_commission_rate(0.50, "High Commission Platform")
+        fresh_manager.set_platform("PredictIt")  # Percentage based
+        predictit_rate = fresh_manager.get_commission_rate()
         
-        # Assert
-        assert manager.get_commission_rate() == 0.50
-        assert manager.get_current_platform() == "High Commission Platform"
-    
-    def test_commission_structure_switching(self):
-        """Test switching between different commission structures."""
-        # Arrange
-        with patch.object(Path, 'exists', return_value=False):
-            manager = CommissionManager()
+        fresh_manager.set_platform("Kalshi")  # Zero commission
+        kalshi_rate = fresh_manager.get_commission_rate()
         
-        with patch.object(manager, '_save_settings'):
-            # Act - Switch through different structures
-            manager.set_platform("Robinhood")  # Fixed per contract
-            robinhood_rate = manager.get_commission_rate()
-            
-            manager.set_platform("PredictIt")  # Percentage based
-            predictit_rate = manager.get_commission_rate()
-            
-            manager.set_platform("Kalshi")  # Zero commission
-            kalshi_rate = manager.get_commission_rate()
-            
-            manager.set_commission_rate(0.15, "Custom")  # Custom rate
-            custom_rate = manager.get_commission_rate()
+        fresh_manager.set_commission_rate(0.15, "Custom")  # Custom rate
+        custom_rate = fresh_manager.get_commission_rate()
         
         # Assert
         assert robinhood_rate == 0.02
         assert predictit_rate == 0.10
         assert kalshi_rate == 0.00
         assert custom_rate == 0.15
-        assert manager.get_current_platform() == "Custom"
\ No newline at end of file
+        assert fresh_manager.get_current_platform() == "Custom"
\ No newline at end of file
@@ -6,6 +6,7 @@ with clear arrange-act-assert structure.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 import sys
 import os
@@ -23,11 +24,96 @@ from src.excel_processor import (
     process_betting_excel,
     apply_bankroll_allocation,
     display_summary,
+    build_result_row,
     COLUMN_CONFIG,
     QUICK_VIEW_MAPPING
 )
 
 
+BET_RESULT = {
+    'decision': 'BET',
+    'bet_amount': 50.0,
+    'ev_percentage': 15.0,
+    'bet_percentage': 5.0,
+    'contracts_to_buy': 185,
+    'adjusted_price': 0.27,
+    'target_bet_amount': 50.0,
+    'unused_amount': 0.05,
+    'expected_profit': 7.5,
+    'reason': ''
+}
+
+NO_BET_RESULT = {
+    'decision': 'NO BET',
+    'bet_amount': 0.0,
+    'ev_percentage': 8.0,  # Below threshold
+    'bet_percentage': 0.0,
+    'contracts_to_buy': 0,
+    'adjusted_price': 0.48,
+    'target_bet_amount': 0.0,
+    'unused_amount': 0.0,
+    'expected_profit': 0.0,
+    'reason': 'EV below 10% threshold'
+}
+
+RESULT_ROW_CASES = [
+    {
+        'id': 'bet_percentage_inputs',
+        'input_row': {'Game': 'Team A vs Team B', 'Model Win Percentage': 65, 'Contract Price': 27},
+        'betting_result': BET_RESULT,
+        'expected': {
+            'Win %': 0.65,  # Converted from 65
+            'Contract Price (¢)': 27,
+            'Decision': 'BET',
+            'EV Percentage': 0.15,  # Converted from 15.0
+            'Contracts To Buy': 185,
+            'Net Profit': pytest.approx(185 - 185 * 0.27),
+            'Commission Rate': 0.05,
+            'Platform': 'Test Platform',
+        },
+    },
+    {
+        'id': 'no_bet',
+        'input_row': {'Game': 'Team A vs Team B', 'Model Win Percentage': 0.55, 'Contract Price': 0.46},
+        'betting_result': NO_BET_RESULT,
+        'expected': {
+            'Win %': 0.55,
+            'Decision': 'NO BET',
+            'Bet Amount': 0.0,
+            'EV Percentage': 0.08,  # 8% converted to decimal
+            'Contracts To Buy': 0,
+            'Net Profit': 0,
+            'Reason': 'EV below 10% threshold',
+        },
+    },
+    {
+        'id': 'no_bet_commission_impact',
+        'input_row': {'Game': 'Team A vs Team B', 'Model Win Percentage': 55, 'Contract Price': 46},
+        'betting_result': {**NO_BET_RESULT, 'commission_impact': 2.5},
+        'expected': {'Reason': 'EV below 10% threshold [Commission impact: -2.5% EV]'},
+    },
+    {
+        'id': 'margin_present',
+        'input_row': pd.Series({'Game': 'Team A vs Team B', 'Model Win Percentage': 65, 'Model Margin': 3.5, 'Contract Price': 27}),
+        'betting_result': BET_RESULT,
+        'expected': {'Margin': 3.5},
+    },
+    {
+        'id': 'margin_missing_value',
+        'input_row': pd.Series({'Game': 'Team C vs Team D', 'Model Win Percentage': 58, 'Model Margin': float('nan'), 'Contract Price': 45}),
+        'betting_result': NO_BET_RESULT,
+        'expected': {'Decision': 'NO BET'},
+    },
+    {
+        'id': 'commission_override',
+        'input_row': {'Game': 'Team A vs Team B', 'Model Win Percentage': 65, 'Contract Price': 27},
+        'betting_result': {**BET_RESULT, 'adjusted_price': 0.30},
+        'commission_rate': 0.03,
+        'expected': {'Commission Rate': 0.03, 'Adjusted Price': 0.30, 'Platform': 'Test Platform'},
+    },
+]
+
+
 class TestGetRequiredInputColumns:
     """Test required input column identification."""
     
@@ -102,34 +188,26 @@ class TestGetDynamicExplanation:
 class TestApplyExcelFormatting:
     """Test Excel worksheet formatting functionality."""
     
-    def test_apply_excel_formatting_basic(self):
+    def test_apply_excel_formatting_basic(self, fake_ws):
         """Test basic Excel formatting application."""
         # Arrange
-        mock_worksheet = MagicMock()
-        mock_cell = MagicMock()
-        mock_worksheet.cell.return_value = mock_cell
-        mock_worksheet.__getitem__ = MagicMock(return_value=mock_cell)
-        
         df = pd.DataFrame({
             'Game': ['Team A vs Team B'],
             'EV Percentage': [0.15]
         })
         
         # Act
-        apply_excel_formatting(mock_worksheet, df)
+        apply_excel_formatting(fake_ws, df)
         
         # Assert
-        # Should have been called to format cells
-        assert mock_worksheet.cell.called or mock_worksheet.__getitem__.called
+        assert fake_ws.cell_calls > 0
+        assert fake_ws.cells[(2, 1)].number_format == '@'
+        assert fake_ws.cells[(2, 2)].number_format == '0.00%'
+        assert fake_ws.cells[(1, 2)].alignment.horizontal == 'center'
     
-    def test_apply_excel_formatting_with_custom_mapping(self):
+    def test_apply_excel_formatting_with_custom_mapping(self, fake_ws):
         """Test Excel formatting with custom format mapping."""
         # Arrange
-        mock_worksheet = MagicMock()
-        mock_cell = MagicMock()
-        mock_worksheet.cell.return_value = mock_cell
-        mock_worksheet.__getitem__ = MagicMock(return_value=mock_cell)
-        
         df = pd.DataFrame({'Test Column': [100]})
         custom_mapping = {
             'Test Column': {
@@ -139,55 +217,43 @@ class TestApplyExcelFormatting:
         }
         
         # Act
-        apply_excel_formatting(mock_worksheet, df, custom_mapping)
+        apply_excel_formatting(fake_ws, df, custom_mapping)
         
         # Assert
-        # Should have attempted to format the cell
-        assert mock_worksheet.cell.called or mock_worksheet.__getitem__.called
+        assert fake_ws.cell_calls > 0
+        assert fake_ws.cells[(2, 1)].number_format == '$0.00'
+        assert fake_ws.cells[(1, 1)].comment.text == 'Test explanation'
 
 
 class TestAdjustColumnWidths:
     """Test column width adjustment functionality."""
     
-    def test_adjust_column_widths_basic(self):
+    def test_adjust_column_widths_basic(self, fake_ws):
         """Test basic column width adjustment."""
         # Arrange
-        mock_worksheet = MagicMock()
-        mock_column = MagicMock()
-        mock_cell = MagicMock()
-        mock_cell.value = 'Test Header'
-        mock_cell.column_letter = 'A'
-        mock_column.__iter__ = MagicMock(return_value=iter([mock_cell]))
-        mock_worksheet.columns = [mock_column]
-        mock_worksheet.column_dimensions = {}
+        fake_ws.cell(row=1, column=1).value = 'Test Header'
         
         # Act
-        adjust_column_widths(mock_worksheet)
+        adjust_column_widths(fake_ws)
         
         # Assert
-        # Should have processed the columns
-        assert mock_worksheet.columns is not None
+        assert fake_ws.column_dimensions['A'].width == len('Test Header') + 2
     
-    def test_adjust_column_widths_with_dataframe(self):
+    def test_adjust_column_widths_with_dataframe(self, fake_ws):
         """Test column width adjustment with DataFrame context."""
         # Arrange
-        mock_worksheet = MagicMock()
-        mock_column = MagicMock()
-        mock_cell = MagicMock()
-        mock_cell.value = 'Long Header Name'
-        mock_cell.column_letter = 'A'
-        mock_column.__iter__ = MagicMock(return_value=iter([mock_cell]))
-        mock_worksheet.columns = [mock_column]
-        mock_worksheet.column_dimensions = {}
+        fake_ws.cell(row=1, column=1).value = 'Long Header Name'
+        fake_ws.cell(row=2, column=1).value = 'Some data'
+        fake_ws.cell(row=1, column=2).value = 'X'
         
-        df = pd.DataFrame({'Long Header Name': ['Some data']})
+        df = pd.DataFrame({'Long Header Name': ['Some data'], 'X': [1]})
         
         # Act
-        adjust_column_widths(mock_worksheet, df)
+        adjust_column_widths(fake_ws, df)
         
         # Assert
-        # Should have processed the worksheet
-        assert mock_worksheet.columns is not None
+        assert fake_ws.column_dimensions['A'].width == len('Long Header Name') + 2
+        assert fake_ws.column_dimensions['B'].width == 8  # Clamped to the minimum width
 
 
 class TestFileOperations:
@@ -274,131 +340,31 @@ class TestProcessBettingExcel:
         assert result_df is None
         assert output_file is None
     
-    def test_process_betting_excel_data_transformation(self):
-        """Test data transformation logic in Excel processing."""
-        # This test focuses on the data transformation logic without file I/O
-        # Arrange
-        input_data = {
-            'Game': 'Team A vs Team B',
-            'Model Win Percentage': 65,  # Should be converted to 0.65
-            'Contract Price': 27  # Should be converted to 0.27
-        }
-        
-        betting_result = {
-            'decision': 'BET',
-            'bet_amount': 50.0,
-            'ev_percentage': 15.0,
-            'bet_percentage': 5.0,
-            'contracts_to_buy': 185,
-            'adjusted_price': 0.27,
-            'target_bet_amount': 50.0,
-            'unused_amount': 0.05,
-            'expected_profit': 7.5,
-            'reason': ''
-        }
-        
-        # Act - Test the data transformation logic
-        result_row = {
-            'Game': input_data['Game'],
-            'Win %': input_data['Model Win Percentage'] / 100 if input_data['Model Win Percentage'] > 1 else input_data['Model Win Percentage'],
-            'Contract Price (¢)': input_data['Contract Price'],
-            'Decision': betting_result['decision'],
-            'EV Percentage': betting_result['ev_percentage'] / 100,
-            'Bet Amount': betting_result['bet_amount'],
-            'Bet Percentage': betting_result.get('bet_percentage', 0) / 100,
-            'Contracts To Buy': betting_result.get('contracts_to_buy', 0),
-            'Adjusted Price': betting_result.get('adjusted_price', 0),
-        }
-        
-        # Assert
-        assert result_row['Win %'] == 0.65  # Converted from 65
-        assert result_row['Contract Price (¢)'] == 27
-        assert result_row['Decision'] == 'BET'
-        assert result_row['EV Percentage'] == 0.15  # Converted from 15.0
-        assert result_row['Contracts To Buy'] == 185
-    
-    def test_process_betting_excel_margin_handling(self):
-        """Test handling of optional margin data in Excel processing."""
-        # Test the logic for handling margin data
-        # Arrange
-        row_with_margin = pd.Series({
-            'Game': 'Team A vs Team B',
-            'Model Win Percentage': 65,
-            'Model Margin': 3.5,
-            'Contract Price': 27
-        })
-        
-        row_without_margin = pd.Series({
-            'Game': 'Team C vs Team D',
-            'Model Win Percentage': 58,
-            'Contract Price': 45
-        })
-        
-        # Act - Test margin handling logic
-        # Check if margin exists and is not null
-        margin_val_1 = None
-        if 'Model Margin' in row_with_margin.index:
-            margin_val = row_with_margin.get('Model Margin', None)
-            if pd.notna(margin_val):
-                margin_val_1 = margin_val
-        
-        margin_val_2 = None
-        if 'Model Margin' in row_without_margin.index:
-            margin_val = row_without_margin.get('Model Margin', None)
-            if pd.notna(margin_val):
-                margin_val_2 = margin_val
-        
-        # Assert
-        assert margin_val_1 == 3.5  # Should capture the margin value
-        assert margin_val_2 is None  # Should be None when margin doesn't exist
-    
-    def test_process_betting_excel_no_bet_logic(self):
-        """Test logic for handling NO BET decisions in Excel processing."""
-        # Test the data transformation for NO BET scenarios
+    @pytest.mark.parametrize("case", RESULT_ROW_CASES, ids=lambda c: c['id'])
+    @patch('src.excel_processor.commission_manager')
+    def test_build_result_row(self, mock_commission_manager, case):
+        """Test that framework results are transformed into output rows."""
         # Arrange
-        betting_result = {
-            'decision': 'NO BET',
-            'bet_amount': 0.0,
-            'ev_percentage': 8.0,  # Below threshold
-            'bet_percentage': 0.0,
-            'contracts_to_buy': 0,
-            'adjusted_price': 0.48,
-            'target_bet_amount': 0.0,
-            'unused_amount': 0.0,
-            'expected_profit': 0.0,
-            'reason': 'EV below 10% threshold'
-        }
+        mock_commission_manager.get_commission_rate.return_value = 0.05
+        mock_commission_manager.get_current_platform.return_value = 'Test Platform'
         
-        # Act - Test the result row creation logic
-        result_row = {
-            'Game': 'Team A vs Team B',
-            'Decision': betting_result['decision'],
-            'Bet Amount': betting_result['bet_amount'],
-            'EV Percentage': betting_result['ev_percentage'] / 100,
-            'Contracts To Buy': betting_result.get('contracts_to_buy', 0),
-            'Expected Value EV': betting_result.get('expected_profit', 0),
-            'Reason': betting_result.get('reason', '')
-        }
+        # Act
+        result_row = build_result_row(case['input_row'], case['betting_result'], case.get('commission_rate'))
         
         # Assert
-        assert result_row['Decision'] == 'NO BET'
-        assert result_row['Bet Amount'] == 0.0
-        assert result_row['EV Percentage'] == 0.08  # 8% converted to decimal
-        assert result_row['Contracts To Buy'] == 0
-        assert 'EV' in result_row['Reason']
+        for column, expected in case['expected'].items():
+            assert result_row[column] == expected, column
+        assert ('Margin' in result_row) == ('Margin' in case['expected'])
+        mock_commission_manager.get_current_platform.assert_called()
 
 
 class TestApplyBankrollAllocation:
     """Test bankroll allocation logic."""
     
-    def test_apply_bankroll_allocation_sufficient_funds(self):
+    def test_apply_bankroll_allocation_sufficient_funds(self, sufficient_funds_df):
         """Test bankroll allocation when sufficient funds are available."""
         # Arrange
-        df = pd.DataFrame({
-            'Decision': ['BET', 'BET', 'NO BET'],
-            'Bet Amount': [100.0, 150.0, 0.0],
-            'EV Percentage': [0.15, 0.12, 0.08]  # Already sorted by EV
-        })
+        df = sufficient_funds_df.copy()  # apply_bankroll_allocation adds columns in place
         weekly_bankroll = 1000.0
         
         # Act
@@ -412,14 +378,10 @@ class TestApplyBankrollAllocation:
         assert result_df.iloc[1]['Cumulative Bet Amount'] == 150.0
         assert result_df.iloc[2]['Cumulative Bet Amount'] == 0.0
     
-    def test_apply_bankroll_allocation_insufficient_funds(self):
+    def test_apply_bankroll_allocation_insufficient_funds(self, insufficient_funds_df):
         """Test bankroll allocation when funds are insufficient for all bets."""
         # Arrange
-        df = pd.DataFrame({
-            'Decision': ['BET', 'BET', 'BET'],
-            'Bet Amount': [400.0, 300.0, 200.0],
-            'EV Percentage': [0.15, 0.12, 0.10]  # Already sorted by EV
-        })
+        df = insufficient_funds_df.copy()
         weekly_bankroll = 500.0  # Not enough for all bets
         
         # Act
@@ -433,14 +395,10 @@ class TestApplyBankrollAllocation:
         assert result_df.iloc[1]['Cumulative Bet Amount'] == 100.0
         assert result_df.iloc[2]['Cumulative Bet Amount'] == 0.0
     
-    def test_apply_bankroll_allocation_very_small_remaining(self):
+    def test_apply_bankroll_allocation_very_small_remaining(self, small_remaining_df):
         """Test bankroll allocation when remaining funds are too small for partial bet."""
         # Arrange
-        df = pd.DataFrame({
-            'Decision': ['BET', 'BET'],
-            'Bet Amount': [995.0, 100.0],
-            'EV Percentage': [0.15, 0.12]
-        })
+        df = small_remaining_df.copy()
         weekly_bankroll = 1000.0  # Only $5 left after first bet
         
         # Act
@@ -452,14 +410,10 @@ class TestApplyBankrollAllocation:
         assert result_df.iloc[0]['Cumulative Bet Amount'] == 995.0
         assert result_df.iloc[1]['Cumulative Bet Amount'] == 0.0
     
-    def test_apply_bankroll_allocation_no_bet_decisions_unchanged(self):
+    def test_apply_bankroll_allocation_no_bet_decisions_unchanged(self, no_bet_mixed_df):
         """Test that NO BET decisions pass through unchanged."""
         # Arrange
-        df = pd.DataFrame({
-            'Decision': ['NO BET', 'BET', 'NO BET'],
-            'Bet Amount': [0.0, 100.0, 0.0],
-            'EV Percentage': [0.08, 0.15, 0.05]
-        })
+        df = no_bet_mixed_df.copy()
         weekly_bankroll = 1000.0
         
         # Act
@@ -472,59 +426,126 @@ class TestApplyBankrollAllocation:
         assert result_df.iloc[0]['Cumulative Bet Amount'] == 0.0
         assert result_df.iloc[1]['Cumulative Bet Amount'] == 100.0
         assert result_df.iloc[2]['Cumulative Bet Amount'] == 0.0
+    
+    @pytest.mark.parametrize("weekly_bankroll", [10.0, 1000.0, 10000.0])
+    def test_apply_bankroll_allocation_single_game(self, weekly_bankroll):
+        """Test that a single affordable BET is allocated in full."""
+        # Arrange
+        bet_amount = min(weekly_bankroll * 0.1, 50.0)
+        df = pd.DataFrame({
+            'Decision': ['BET'],
+            'Bet Amount': [bet_amount],
+            'EV Percentage': [0.15]
+        })
+        
+        # Act
+        result_df = apply_bankroll_allocation(df, weekly_bankroll)
+        
+        # Assert
+        assert len(result_df) == 1
+        assert result_df.iloc[0]['Final Recommendation'] == 'BET'
+        assert result_df.iloc[0]['Cumulative Bet Amount'] == bet_amount
+    
+    def test_apply_bankroll_allocation_smaller_bet_fits_after_skip(self):
+        """Test that a sub-1% skip keeps the balance for a smaller later bet."""
+        # Arrange
+        df = pd.DataFrame({
+            'Decision': ['BET', 'BET', 'NO BET', 'BET', 'BET'],
+            'Bet Amount': [995.0, 20.0, 0.0, 3.0, 5.0],
+            'EV Percentage': [0.20, 0.15, 0.0, 0.12, 0.11]
+        })
+        weekly_bankroll = 1000.0  # $5 left after first bet
+        
+        # Act
+        result_df = apply_bankroll_allocation(df, weekly_bankroll)
+        
+        # Assert
+        assert list(result_df['Final Recommendation']) == [
+            'BET', 'SKIP - Insufficient Bankroll', 'NO BET', 'BET', 'SKIP - Insufficient Bankroll'
+        ]
+        assert list(result_df['Cumulative Bet Amount']) == [995.0, 0.0, 0.0, 3.0, 0.0]
+        
+    def test_apply_bankroll_allocation_matches_sequential_reference(self):
+        """Test that allocation matches a row-by-row walk over random slates."""
+        # Arrange
+        rng = np.random.default_rng(42)
+        
+        def sequential_reference(decisions, amounts, bankroll):
+            remaining, recommendations, cumulative = bankroll, [], []
+            for decision, amount in zip(decisions, amounts):
+                if decision != 'BET':
+                    recommendations.append(decision)
+                    cumulative.append(0.0)
+                elif remaining > 0 and amount <= remaining:
+                    recommendations.append('BET')
+                    cumulative.append(float(amount))
+                    remaining -= amount
+                elif remaining > 0 and remaining >= bankroll * 0.01:
+                    recommendations.append(f'PARTIAL BET (${remaining:.2f})')
+                    cumulative.append(float(remaining))
+                    remaining = 0
+                else:
+                    recommendations.append('SKIP - Insufficient Bankroll')
+                    cumulative.append(0.0)
+            return recommendations, cumulative
+        
+        for _ in range(200):
+            size = int(rng.integers(1, 12))
+            decisions = list(rng.choice(['BET', 'NO BET'], size=size, p=[0.7, 0.3]))
+            amounts = list(np.round(rng.uniform(0.01, 300.0, size=size), 2))
+            bankroll = float(rng.choice([0.0, 50.0, 250.0, 1000.0]))
+            df = pd.DataFrame({'Decision': decisions, 'Bet Amount': amounts})
+        
+            # Act
+            result_df = apply_bankroll_allocation(df, bankroll)
+        
+            # Assert
+            expected_recommendations, expected_cumulative = sequential_reference(decisions, amounts, bankroll)
+            assert list(result_df['Final Recommendation']) == expected_recommendations
+            assert list(result_df['Cumulative Bet Amount']) == expected_cumulative
 
 
 class TestDisplaySummary:
     """Test summary display functionality."""
     
-    def test_display_summary_basic(self, capsys):
+    def test_display_summary_basic(self, capsys, summary_df):
         """Test basic summary display functionality."""
         # Arrange
-        df = pd.DataFrame({
-            'Decision': ['BET', 'NO BET', 'BET'],
-            'Final Recommendation': ['BET', 'NO BET', 'SKIP - Insufficient Bankroll'],
-            'Cumulative Bet Amount': [100.0, 0.0, 0.0],
-            'Expected Value EV': [15.0, 0.0, 12.0],
-            'Contracts To Buy': [370, 0, 444],
-            'EV Percentage': [0.15, 0.08, 0.12],  # Add missing column
-            'Game': ['Game 1', 'Game 2', 'Game 3'],
-            'Adjusted Price': [0.27, 0.48, 0.35]
-        })
         weekly_bankroll = 1000.0
         
         # Act
-        display_summary(df, weekly_bankroll)
+        stats = display_summary(summary_df, weekly_bankroll)
         
         # Assert
-        captured = capsys.readouterr()
-        assert 'BETTING ANALYSIS SUMMARY' in captured.out
-        assert 'Total Games Analyzed: 3' in captured.out
-        assert 'Initial BET Opportunities: 2' in captured.out
-        assert 'NO BET Games: 1' in captured.out
-        assert 'Final Recommended Bets: 1' in captured.out
+        assert 'BETTING ANALYSIS SUMMARY' in capsys.readouterr().out
+        assert stats['total_games'] == 3
+        assert stats['bet_opportunities'] == 2
+        assert stats['no_bet_games'] == 1
+        assert stats['final_bets'] == 1
+        assert stats['total_allocated'] == 100.0
+        assert stats['remaining_bankroll'] == 900.0
+        assert stats['total_contracts'] == 370
 
 
 class TestDataValidation:
     """Test data validation and error handling."""
     
-    def test_column_config_consistency(self):
-        """Test that COLUMN_CONFIG is properly structured."""
+    @pytest.mark.parametrize("column_name, config", list(COLUMN_CONFIG.items()))
+    def test_column_config_consistency(self, column_name, config):
+        """Test that each COLUMN_CONFIG entry is properly structured."""
         # Act & Assert
-        for column_name, config in COLUMN_CONFIG.items():
-            assert isinstance(config, dict)
-            assert 'explanation' in config
-            assert 'is_input' in config
-            if config.get('format_type'):
-                assert config['format_type'] in ['percentage', 'currency', 'text', None]
+        assert isinstance(config, dict)
+        assert 'explanation' in config
+        assert 'is_input' in config
+        assert config.get('format_type') in {'percentage', 'currency', 'text', None}
     
-    def test_quick_view_mapping_consistency(self):
-        """Test that QUICK_VIEW_MAPPING references valid columns."""
+    @pytest.mark.parametrize("original_col, quick_col", list(QUICK_VIEW_MAPPING.items()))
+    def test_quick_view_mapping_consistency(self, original_col, quick_col):
+        """Test that each QUICK_VIEW_MAPPING entry maps to a non-empty name."""
         # Act & Assert
-        for original_col, quick_col in QUICK_VIEW_MAPPING.items():
-            # Original column should exist in COLUMN_CONFIG or be a known output column
-            assert isinstance(original_col, str)
-            assert isinstance(quick_col, str)
-            assert len(quick_col) > 0
+        assert isinstance(original_col, str)
+        assert isinstance(quick_col, str)
+        assert len(quick_col) > 0
     
     def test_required_columns_are_input_columns(self):
         """Test that all required columns are marked as input columns."""
@@ -571,6 +592,25 @@ class TestErrorHandling:
         assert result_df is None
         assert output_file is None
     
+    @patch('src.excel_processor.user_input_betting_framework')
+    def test_process_betting_excel_non_numeric_cell_fails_at_read(self, mock_betting_framework, tmp_path):
+        """Test that a non-numeric input cell is rejected before any game is processed."""
+        # Arrange
+        excel_file = tmp_path / 'invalid.xlsx'
+        pd.DataFrame({
+            'Game': ['Team A vs Team B'],
+            'Model Win Percentage': ['invalid'],
+            'Contract Price': [27]
+        }).to_excel(excel_file, sheet_name='Games', index=False)
+        
+        # Act
+        result_df, output_file = process_betting_excel(excel_file, 1000.0, sheet_name='Games')
+        
+        # Assert
+        assert result_df is None
+        assert output_file is None
+        mock_betting_framework.assert_not_called()
+    
     def test_apply_bankroll_allocation_empty_dataframe(self):
         """Test bankroll allocation with empty DataFrame."""
         # Arrange
@@ -602,46 +642,3 @@ class TestErrorHandling:
         assert result_df.iloc[1]['Final Recommendation'] == 'SKIP - Insufficient Bankroll'
         assert result_df.iloc[0]['Cumulative Bet Amount'] == 0.0
         assert result_df.iloc[1]['Cumulative Bet Amount'] == 0.0
-
-
-class TestIntegrationWithBettingFramework:
-    """Test integration between Excel processor and betting framework."""
-    
-    @patch('src.excel_processor.commission_manager')
-    def test_commission_manager_integration_logic(self, mock_commission_manager):
-        """Test that commission manager integration logic works correctly."""
-        # Test the commission integration without file I/O complexity
-        # Arrange
-        mock_commission_manager.get_commission_rate.return_value = 0.05
-        mock_commission_manager.get_current_platform.return_value = 'Test Platform'
-        
-        betting_result = {
-            'decision': 'BET',
-            'bet_amount': 50.0,
-            'ev_percentage': 15.0,
-            'bet_percentage': 5.0,
-            'contracts_to_buy': 185,
-            'adjusted_price': 0.32,  # 0.27 + 0.05 commission
-            'target_bet_amount': 50.0,
-            'unused_amount': 0.05,
-            'expected_profit': 7.5,
-            'reason': ''
-        }
-        
-        # Act - Test commission data inclusion logic
-        result_row = {
-            'Game': 'Team A vs Team B',
-            'Decision': betting_result['decision'],
-            'Commission Rate': mock_commission_manager.get_commission_rate(),
-            'Platform': mock_commission_manager.get_current_platform(),
-            'Adjusted Price': betting_result.get('adjusted_price', 0)
-        }
-        
-        # Assert
-        assert result_row['Commission Rate'] == 0.05
-        assert result_row['Platform'] == 'Test Platform'
-        assert result_row['Adjusted Price'] == 0.32
-        
-        # Verify commission manager methods were called
-        mock_commission_manager.get_commission_rate.assert_called()
-        mock_commission_manager.get_current_platform.assert_called()
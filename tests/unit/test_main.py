@@ -8,6 +8,7 @@ and application startup functionality with clear arrange-act-assert structure.
 import pytest
 import sys
 import os
+import time
 from unittest.mock import patch, MagicMock, call, mock_open
 from io import StringIO
 
@@ -785,8 +786,6 @@ class TestPerformanceAndConstraints:
     
     def test_fast_execution_constraints(self):
         """Test that test execution meets speed requirements."""
-        import time
-        
         # Arrange
         start_time = time.time()
         